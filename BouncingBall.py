@@ -1,6 +1,8 @@
 import pygame
 import sys
 import random
+from scenes import replace
+from runtime import register, get_font, clock
 
 pygame.init()
 
@@ -8,7 +10,6 @@ def bounce():
   display_info = pygame.display.Info()
   width, height = display_info.current_w, display_info.current_h
   FPS = 100
-  clock = pygame.time.Clock()
   
   black = (0, 0, 0)
   white = (255, 255, 255)
@@ -17,10 +18,9 @@ def bounce():
   orange = (255, 165, 0)
   light_blue = (173, 116, 233)
   
-  screen = pygame.display.set_mode((width, height))
+  screen = register('Bouncing Ball Game')
   screen_color = black
-  pygame.display.set_caption('Bouncing Ball Game')
-  font = pygame.font.Font(None, 36)
+  font = get_font(36)
   
   platform_width1, platform_height1 = 150, 20
   platform_pos1 = [width // 2 - platform_width1 // 2, height - platform_height1 - 10]
@@ -129,7 +129,7 @@ def bounce():
             sys.exit()
 
   def show_text_on_screen(text, font_size, y_position):
-    font = pygame.font.Font(None, font_size)
+    font = get_font(font_size)
     text_render = font.render(text, True, gray)
     text_rect = text_render.get_rect(center=(width // 2, y_position))
     screen.blit(text_render, text_rect)
@@ -167,7 +167,7 @@ def bounce():
           pygame.quit()
           sys.exit()
         elif event.key == pygame.K_LSHIFT:
-          bounce()
+          return replace(bounce)
 
     keys = pygame.key.get_pressed()
     platform_pos1[0] += ((keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * platform_speed) - ((keys[pygame.K_a] - keys[pygame.K_d]) * platform_speed)
@@ -283,10 +283,7 @@ def bounce():
       platform_pos1 = [width // 2 - platform_width1 // 2, height - platform_height1 - 10]
       if lives == 0:
         end_screen()
-        bounce()
-        score = 0
-        lives = 3
-        current_level = 1
+        return replace(bounce)
       else:
         ball_pos = [width // 2, height // 2]
         if (ball_speed[1] > 0):
@@ -294,7 +291,7 @@ def bounce():
 
     if score == 40:
       victory_screen()
-      bounce()
+      return replace(bounce)
 
     screen.fill(screen_color)
     
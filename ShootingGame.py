@@ -3,50 +3,51 @@ import pygame
 from math import *
 from random import randint, uniform
 import sys
+import os
+from time import perf_counter
+from collections import deque
+from scenes import replace
+from runtime import register, get_font, image, clock
+from bullets import BulletPool
+from patterns import Pattern
+from collision import segment_circle_hits
+from spatial import SpatialGrid
+from hud import Hud
+import numpy as np
 
 # pygame setup
 
 pygame.init()
 pygame.font.init()
-pygame.display.set_caption("shooting game (testing)")
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+screen = register("shooting game (testing)", pygame.FULLSCREEN)
 
 screen_width, screen_height = screen.get_size()
 
-school_logo = pygame.image.load("school_logo.png")
-school_logo.set_alpha(128)
+school_logo = image("school_logo.png", 128)
 image_rect = school_logo.get_rect()
 image_rect.topright = (screen_width, 0)
 
 t_screen = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
 
-default_font = pygame.font.Font(None, 65)
+default_font = get_font(65)
 
+# Timer and score, drawn over whatever is on the screen
+hud = Hud(default_font, (128, 128, 128, 128), [(30, 30), (30, 78)])
 
 
-debug_mode = False # Not die
-
-# Check if a line intersects with a circle
-def itlc(x0, y0, r, x1, y1, x2, y2):
-    dx = x2 - x1
-    dy = y2 - y1
 
-    a = dx**2 + dy**2
-    b = 2 * (dx * (x1 - x0) + dy * (y1 - y0))
-    c = (x1 - x0)**2 + (y1 - y0)**2 - r**2
-
-    D = b**2 - 4 * a * c
+debug_mode = False # Not die
 
-    if D < 0:
-        return False
+# Enemy volleys, see patterns.py for the spec ("spiral 12; aimed 1" ...)
+bullet_pattern = "ring"
 
-    sqrtD = sqrt(D)
-    t1 = (-b - sqrtD) / (2 * a)
-    t2 = (-b + sqrtD) / (2 * a)
+# Bucket bullets in a spatial.SpatialGrid and hit-test only the cells around
+# the player, instead of one vectorised pass over every bullet
+collision_grid = False
 
-    if (0 <= t1 <= 1) or (0 <= t2 <= 1):
-        return True
-    return False
+# SHOOTING_STRESS=<n> starts with n enemies, nothing kills the player, and
+# the collision phase is timed both ways and printed every 60 frames
+stress_enemies = int(os.environ.get("SHOOTING_STRESS", 0))
 
 # Drawing button with text
 def dbwt(screen, button_rect, text, font, text_color, button_color):
@@ -57,18 +58,18 @@ def dbwt(screen, button_rect, text, font, text_color, button_color):
 
 # Showing Timer
 def show_info(start_time, score):
-    info_screen = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-    info_screen.fill((0, 0, 0, 255))
     current_time = pygame.time.get_ticks()
     elapsed_time = round((current_time - start_time) / 1000, 3)
-    timer_text = default_font.render(f"Time: {elapsed_time}", True, (128, 128, 128, 128))
-    info_screen.blit(timer_text, (30, 30))
-
     score = round(elapsed_time * 25 + score * 250)
-    score_text = default_font.render(f"Score: {score}", True, (128, 128, 128, 128))
-    info_screen.blit(score_text, (30, 78))
+    hud.draw(screen, [f"Time: {elapsed_time}", f"Score: {score}"])
 
-    screen.blit(info_screen, (0, 0))
+# Bullets near the player through the spatial grid, then the exact test
+def grid_hits(grid, player_pos, player_size, line_len, x0, y0, x1, y1):
+    grid.build(x0, y0)
+    reach = player_size + line_len
+    near = grid.query(player_pos.x - reach, player_pos.y - reach, player_pos.x + reach, player_pos.y + reach)
+    return segment_circle_hits(player_pos.x, player_pos.y, player_size,
+                               x0[near], y0[near], x1[near], y1[near]).any()
 
 # Main screen
 def shooting_game():
@@ -99,23 +100,20 @@ def shooting_game():
 
             # Start game
             if keys[pygame.K_RETURN]:
-                htp()
+                return replace(htp)
             
             if keys[pygame.K_ESCAPE]:
                 sys.exit()
 
             if mouse_click[0]:
                 if start_button.collidepoint(mouse_pos):
-                    htp()
+                    return replace(htp)
 
         pygame.display.flip()
 
 # Restart Screen
 def restart(start_time, score):
 
-    if debug_mode == True:
-        return
-
     screen.fill("black")
     screen.blit(school_logo, image_rect)
     pygame.display.flip()
@@ -156,19 +154,19 @@ def restart(start_time, score):
 
         # Restart game
         if keys[pygame.K_r]:
-            game()
+            return replace(game)
 
         if mouse_click[0]:
             if restart_button.collidepoint(mouse_pos):
-                game()
+                return replace(game)
 
         # Back to main screen
         if keys[pygame.K_ESCAPE]:
-            shooting_game()
+            return replace(shooting_game)
 
         if mouse_click[0]:
             if back_button.collidepoint(mouse_pos):
-                shooting_game()
+                return replace(shooting_game)
 
         pygame.display.flip()
 
@@ -212,11 +210,11 @@ def htp():
 
             # Start game
             if keys[pygame.K_RETURN]:
-                game()
+                return replace(game)
 
             if mouse_click[0]:
                 if start_button.collidepoint(mouse_pos):
-                    game()
+                    return replace(game)
 
         pygame.display.flip()
 
@@ -227,8 +225,6 @@ def game():
     screen.blit(school_logo, image_rect)
     pygame.display.flip()
 
-    clock = pygame.time.Clock()
-
     # Time
     dt = 0
     time = 0
@@ -244,7 +240,11 @@ def game():
 
     # Objects
     rects = []
-    lines = []
+    bullets = BulletPool()
+    grid = SpatialGrid(screen_width, screen_height, screen_width * 0.06)
+    # Stress mode only, the last 60 frames of each method
+    collision_times = {"scan": deque(maxlen=60), "grid": deque(maxlen=60)}
+    pattern = Pattern(bullet_pattern)
     t_lines = []
     lucky_block = []
 
@@ -269,6 +269,12 @@ def game():
         pygame.Vector2(randint(0, screen_width), randint(0, screen_height)), 0,
         uniform(0, 360)
     ])
+    for _ in range(stress_enemies):
+        rects.append([
+            pygame.Vector2(randint(0, screen_width), randint(0, screen_height)), 0,
+            uniform(0, 360)
+        ])
+    can_die = not (debug_mode or stress_enemies)
 
     # Countdown
 
@@ -362,41 +368,41 @@ def game():
 
         # Create bullet from enemy
         if time >= 180 and time % bullet_reload == 0:
-            for rect_pos, type, dir in rects:
-                for i in range(bullet_amount):
-                    deg = 360/bullet_amount*i
-                    lines.append([rect_pos.x, rect_pos.y, deg])
-
-        nxt_lines = []
-        for line in lines:
-
-            # Drawing bullets
-            line_pos, line_bearing = pygame.Vector2(line[0], line[1]), line[2]
-            end_pos = pygame.Vector2(
-                line_pos.x + line_len * cos(radians(line_bearing)),
-                line_pos.y - line_len * sin(radians(line_bearing)))
-            pygame.draw.line(screen, "white", line_pos, end_pos, 5)
-
-            # Check if collides
-            if itlc(player_pos.x, player_pos.y, player_size, line_pos.x,
-                    line_pos.y, end_pos.x, end_pos.y):
-                restart(start_time, score)
-
-            # Moving the bullets
-            line_pos.x += line_spd * cos(radians(line_bearing))
-            line_pos.y -= line_spd * sin(radians(line_bearing))
-
-            # Delete bullets / Out of screen
-            if 0 <= line_pos.x <= screen_width and 0 <= line_pos.y <= screen_height:
-                nxt_lines.append([line_pos.x, line_pos.y, line_bearing])
+            pattern.spawn(bullets, [rect[0].x for rect in rects], [rect[0].y for rect in rects], player_pos, bullet_amount)
+
+        # Drawing bullets
+        x0, y0, x1, y1 = bullets.segments(line_len)
+        for segment in zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()):
+            pygame.draw.line(screen, "white", segment[:2], segment[2:], 5)
+
+        # Check if collides
+        if stress_enemies:
+            for method in ("grid", "scan"):
+                collision_start = perf_counter()
+                if method == "grid":
+                    hit = grid_hits(grid, player_pos, player_size, line_len, x0, y0, x1, y1)
+                else:
+                    hit = bullets.hits(player_pos.x, player_pos.y, player_size, line_len).any()
+                collision_times[method].append(perf_counter() - collision_start)
+            if time % 60 == 0:
+                print(f"frame {time}: {len(rects)} enemies, {len(bullets)} bullets, collision ms/frame "
+                      + ", ".join(f"{m} {sum(t) * 1000 / len(t):.3f}" for m, t in collision_times.items()))
+        elif collision_grid:
+            hit = grid_hits(grid, player_pos, player_size, line_len, x0, y0, x1, y1)
+        else:
+            hit = bullets.hits(player_pos.x, player_pos.y, player_size, line_len).any()
+        if hit and can_die:
+            return replace(restart, start_time, score)
 
-        lines = nxt_lines
+        # Moving the bullets, out of screen ones are deleted
+        bullets.advance(line_spd, screen_width, screen_height)
 
         # Attack Screen Initialize
         t_screen.fill((0, 0, 0, 0))
         # screen.blit(t_screen, (0, 0))
 
-        # Drawing X-Rays
+        # Drawing X-Rays, the ones firing right now are hit-tested together
+        firing = []
         for t_line in t_lines:
             if t_line[4] > time:
                 pygame.draw.line(t_screen, (255, 255, 255, 128),
@@ -407,15 +413,19 @@ def game():
                                  [t_line[0], t_line[1]],
                                  [t_line[2], t_line[3]], 5)
                 # pygame.display.flip()
-                if itlc(player_pos.x, player_pos.y, player_size, t_line[0], t_line[1], t_line[2], t_line[3]):
-                    pygame.display.flip()
-                    restart(start_time, score)
+                firing.append(t_line[:4])
             else:
                 pygame.draw.line(t_screen, (255, 255, 255, 0),
                                  [t_line[0], t_line[1]],
                                  [t_line[2], t_line[3]], 5)
                 t_lines.remove(t_line)
 
+        if firing and can_die:
+            x1, y1, x2, y2 = np.array(firing, dtype=float).T
+            if segment_circle_hits(player_pos.x, player_pos.y, player_size, x1, y1, x2, y2).any():
+                pygame.display.flip()
+                return replace(restart, start_time, score)
+
         # Random - X-Ray
         xray_random = uniform(0, 1000)
         if xray_random <= xray_chance and time > 180:
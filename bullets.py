@@ -0,0 +1,136 @@
+import numpy as np
+from collision import segment_circle_hits
+
+# Enemy bullets as a structure of arrays: positions and unit directions live
+# in contiguous float arrays, so a frame moves, culls and hit-tests every
+# live bullet in a few NumPy operations instead of a Python loop that builds
+# Vector2s and calls trig per bullet. Directions are screen space (y grows
+# downwards) and are worked out once, when the bullet is spawned.
+class BulletPool:
+
+    def __init__(self, capacity=1024):
+        self.count = 0
+        self.x = np.empty(capacity)
+        self.y = np.empty(capacity)
+        self.dx = np.empty(capacity)
+        self.dy = np.empty(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def grow(self, needed):
+        capacity = len(self.x)
+        while capacity < needed:
+            capacity *= 2
+        for name in ("x", "y", "dx", "dy"):
+            old = getattr(self, name)
+            new = np.empty(capacity)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    # x, y and the direction can be scalars or arrays, they are broadcast
+    def spawn(self, x, y, dx, dy):
+        dx, dy = np.broadcast_arrays(np.atleast_1d(dx), np.atleast_1d(dy))
+        n = len(dx)
+        if self.count + n > len(self.x):
+            self.grow(self.count + n)
+        end = self.count + n
+        self.x[self.count:end] = x
+        self.y[self.count:end] = y
+        self.dx[self.count:end] = dx
+        self.dy[self.count:end] = dy
+        self.count = end
+
+    def clear(self):
+        self.count = 0
+
+    # Start and end points of every bullet drawn length pixels long
+    def segments(self, length):
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        return x, y, x + self.dx[:n] * length, y + self.dy[:n] * length
+
+    # Which bullets cross the edge of the circle
+    def hits(self, cx, cy, r, length):
+        return segment_circle_hits(cx, cy, r, *self.segments(length))
+
+    # Move every bullet speed pixels and drop the ones that left the screen
+    def advance(self, speed, width, height):
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        x += self.dx[:n] * speed
+        y += self.dy[:n] * speed
+        keep = (0 <= x) & (x <= width) & (0 <= y) & (y <= height)
+        kept = int(np.count_nonzero(keep))
+        if kept != n:
+            for array in (self.x, self.y, self.dx, self.dy):
+                array[:kept] = array[:n][keep]
+            self.count = kept
+
+
+if __name__ == "__main__":
+    import os
+    import time
+    from math import cos, sin, radians
+    from collision import itlc
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+
+    width, height = 1920, 1080
+    line_len = width * 0.06
+    line_spd = width * 0.008
+    player = (width / 2, height / 2, width * 0.02)
+
+    # The per-bullet loop game() used to run, without drawing
+    def list_frame(lines):
+        nxt_lines = []
+        for line in lines:
+            line_pos, line_bearing = pygame.Vector2(line[0], line[1]), line[2]
+            end_pos = pygame.Vector2(
+                line_pos.x + line_len * cos(radians(line_bearing)),
+                line_pos.y - line_len * sin(radians(line_bearing)))
+            itlc(player[0], player[1], player[2], line_pos.x, line_pos.y, end_pos.x, end_pos.y)
+            line_pos.x += line_spd * cos(radians(line_bearing))
+            line_pos.y -= line_spd * sin(radians(line_bearing))
+            if 0 <= line_pos.x <= width and 0 <= line_pos.y <= height:
+                nxt_lines.append([line_pos.x, line_pos.y, line_bearing])
+        return nxt_lines
+
+    def pool_frame(pool):
+        pool.hits(player[0], player[1], player[2], line_len).any()
+        pool.advance(line_spd, width, height)
+
+    def draw_pool(surface, pool):
+        x0, y0, x1, y1 = pool.segments(line_len)
+        for segment in zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()):
+            pygame.draw.line(surface, "white", segment[:2], segment[2:], 5)
+
+    def timed(step, frames):
+        begin = time.perf_counter()
+        for _ in range(frames):
+            step()
+        return (time.perf_counter() - begin) * 1000 / frames
+
+    pygame.init()
+    surface = pygame.Surface((width, height))
+    rng = np.random.default_rng(1)
+    print(f"{'bullets':>8} {'lists ms':>10} {'pool ms':>9} {'speedup':>8} {'pool+draw ms':>13}")
+    for count in (100, 1000, 10000, 100000):
+        xs = rng.uniform(0, width, count)
+        ys = rng.uniform(0, height, count)
+        bearings = rng.uniform(0, 360, count)
+        frames = max(3, 30000 // count)
+        # Same bullets each frame, so the live count holds steady
+        lines = [[x, y, b] for x, y, b in zip(xs.tolist(), ys.tolist(), bearings.tolist())]
+        pool = BulletPool()
+
+        def refill():
+            pool.clear()
+            pool.spawn(xs, ys, np.cos(np.radians(bearings)), -np.sin(np.radians(bearings)))
+
+        refill()
+        old = timed(lambda: list_frame(lines), frames)
+        new = timed(lambda: (refill(), pool_frame(pool)), frames)
+        refill()
+        drawn = timed(lambda: (refill(), pool_frame(pool), draw_pool(surface, pool)), max(3, frames // 10))
+        print(f"{count:8} {old:10.3f} {new:9.3f} {old / new:7.1f}x {drawn:13.3f}")
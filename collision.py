@@ -0,0 +1,74 @@
+from math import sqrt
+import numpy as np
+
+# Check if a line intersects with a circle
+def itlc(x0, y0, r, x1, y1, x2, y2):
+    dx = x2 - x1
+    dy = y2 - y1
+
+    a = dx**2 + dy**2
+    b = 2 * (dx * (x1 - x0) + dy * (y1 - y0))
+    c = (x1 - x0)**2 + (y1 - y0)**2 - r**2
+
+    D = b**2 - 4 * a * c
+
+    if D < 0:
+        return False
+
+    sqrtD = sqrt(D)
+    t1 = (-b - sqrtD) / (2 * a)
+    t2 = (-b + sqrtD) / (2 * a)
+
+    if (0 <= t1 <= 1) or (0 <= t2 <= 1):
+        return True
+    return False
+
+# itlc() for whole arrays of segments against one circle: a segment hits when
+# it crosses the circle's edge. Segments whose bounding box misses the
+# circle's box are ruled out first and never reach the quadratic. A
+# zero-length segment only hits when its point sits exactly on the edge,
+# which is where the quadratic's roots go as the segment shrinks.
+def segment_circle_hits(cx, cy, r, x1, y1, x2, y2):
+    x1, y1, x2, y2 = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (x1, y1, x2, y2)))
+    hits = np.zeros(x1.shape, dtype=bool)
+    near = ((np.minimum(x1, x2) <= cx + r) & (np.maximum(x1, x2) >= cx - r)
+            & (np.minimum(y1, y2) <= cy + r) & (np.maximum(y1, y2) >= cy - r))
+    index = np.flatnonzero(near)
+    if len(index) == 0:
+        return hits
+
+    x1, y1, x2, y2 = x1.ravel()[index], y1.ravel()[index], x2.ravel()[index], y2.ravel()[index]
+    dx = x2 - x1
+    dy = y2 - y1
+    a = dx * dx + dy * dy
+    b = 2 * (dx * (x1 - cx) + dy * (y1 - cy))
+    c = (x1 - cx) * (x1 - cx) + (y1 - cy) * (y1 - cy) - r * r
+    D = b * b - 4 * a * c
+    real = D >= 0
+    point = a == 0
+    sqrtD = np.sqrt(np.where(real, D, 0))
+    twice = np.where(point, 1, 2 * a)
+    t1 = (-b - sqrtD) / twice
+    t2 = (-b + sqrtD) / twice
+    crossing = real & (((0 <= t1) & (t1 <= 1)) | ((0 <= t2) & (t2 <= 1)))
+    hits.ravel()[index] = np.where(point, c == 0, crossing)
+    return hits
+
+
+# Timing only, test_collision.py checks the results against itlc()
+if __name__ == "__main__":
+    import time
+    rng = np.random.default_rng(0)
+
+    # One circle against many segments, most of them nowhere near it
+    n = 100000
+    x1, y1, x2, y2 = (rng.uniform(0, 1920, n) for _ in range(4))
+    begin = time.perf_counter()
+    for _ in range(20):
+        segment_circle_hits(960, 540, 38, x1, y1, x2, y2)
+    batched = (time.perf_counter() - begin) / 20
+    begin = time.perf_counter()
+    for i in range(n):
+        itlc(960, 540, 38, x1[i], y1[i], x2[i], y2[i])
+    looped = time.perf_counter() - begin
+    print(f"{n} segments: itlc loop {looped * 1000:.1f} ms, batched {batched * 1000:.2f} ms")
@@ -0,0 +1,68 @@
+import pygame
+import atexit
+import time
+import os
+
+# Shared frame pacing for menu and UI screens. Loops ask for their events
+# through events() right after presenting a frame: screens that animate are
+# capped with clock.tick(fps), static ones block in pygame.event.wait() until
+# something happens, so an idle menu costs no CPU at all.
+ui_fps = int(os.environ.get("UI_FPS", 30))
+# Even a static screen wakes up this often (ms), 0 waits forever
+idle_wake = int(os.environ.get("UI_IDLE_WAKE", 1000))
+# UI_FRAME_REPORT=1 prints CPU time per screen on exit, off in normal builds
+frame_report = os.environ.get("UI_FRAME_REPORT", "0") == "1"
+
+class FrameScheduler:
+  def __init__(self, fps=ui_fps, wake=idle_wake):
+    self.fps = fps
+    self.wake = wake
+    self.clock = pygame.time.Clock()
+    self.current = None
+    self.last_cpu = time.process_time()
+    self.last_wall = time.perf_counter()
+    # screen name -> [frames, cpu seconds, wall seconds, frames spent blocked]
+    self.stats = {}
+
+  # Everything since the previous call belongs to the screen that made it
+  def charge(self):
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    if self.current is not None:
+      entry = self.stats.setdefault(self.current, [0, 0.0, 0.0, 0])
+      entry[0] += 1
+      entry[1] += cpu - self.last_cpu
+      entry[2] += wall - self.last_wall
+    self.last_cpu = cpu
+    self.last_wall = wall
+
+  def events(self, name, animating=False):
+    self.charge()
+    self.current = name
+    if animating:
+      self.clock.tick(self.fps)
+      return pygame.event.get()
+
+    self.stats.setdefault(name, [0, 0.0, 0.0, 0])[3] += 1
+    event = pygame.event.wait(self.wake) if self.wake else pygame.event.wait()
+    # Keep the clock's idea of the last frame current for the next tick()
+    self.clock.tick()
+    if event.type == pygame.NOEVENT:
+      return []
+    return [event] + pygame.event.get()
+
+  def report(self):
+    self.charge()
+    lines = []
+    for name, (frames, cpu, wall, blocked) in sorted(self.stats.items(), key = lambda x : -x[1][1]):
+      share = cpu / wall * 100 if wall else 0
+      lines.append(f"{name:20} {frames:7} frames {blocked:7} blocked {cpu:8.3f}s cpu {wall:8.2f}s wall {share:5.1f}% cpu")
+    return "\n".join(lines)
+
+scheduler = FrameScheduler()
+
+@atexit.register
+def print_report():
+  if scheduler.stats and frame_report:
+    print("CPU time per screen:")
+    print(scheduler.report())
@@ -0,0 +1,77 @@
+import pygame
+
+# Text drawn over the game every frame. Each line keeps the surface it was
+# last rendered to and only renders again when its text changes, and the
+# lines are blitted straight onto the frame: no full-screen layer is
+# allocated, filled or blended behind them.
+class Hud:
+
+    def __init__(self, font, color, positions):
+        self.font = font
+        self.color = color
+        self.positions = positions
+        # slot -> (text, rendered surface)
+        self.lines = {}
+        self.renders = 0
+
+    def line(self, slot, text):
+        cached = self.lines.get(slot)
+        if cached is None or cached[0] != text:
+            cached = self.lines[slot] = (text, self.font.render(text, True, self.color))
+            self.renders += 1
+        return cached[1]
+
+    def draw(self, surface, texts):
+        for slot, text in enumerate(texts):
+            surface.blit(self.line(slot, text), self.positions[slot])
+
+
+if __name__ == "__main__":
+    import os
+    import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    font = pygame.font.Font(None, 65)
+    color = (128, 128, 128, 128)
+    positions = [(30, 30), (30, 78)]
+
+    # What ShootingGame.show_info did every frame before the HUD
+    def old_info(screen, texts):
+        width, height = screen.get_size()
+        info_screen = pygame.Surface((width, height), pygame.SRCALPHA)
+        info_screen.fill((0, 0, 0, 255))
+        for text, position in zip(texts, positions):
+            info_screen.blit(font.render(text, True, color), position)
+        screen.blit(info_screen, (0, 0))
+
+    def new_info(screen, texts):
+        screen.fill("black")
+        hud.draw(screen, texts)
+
+    # A frame every 16 ms: the timer shows milliseconds so it changes every
+    # frame, the score (25 points a second) every two or three frames
+    def texts(frame):
+        elapsed = round(frame * 16 / 1000, 3)
+        return [f"Time: {elapsed}", f"Score: {round(elapsed * 25)}"]
+
+    frames = 300
+    for width, height in ((1920, 1080), (3840, 2160)):
+        screen = pygame.Surface((width, height))
+        hud = Hud(font, color, positions)
+        for frame in (0, 7, 123):
+            old_info(screen, texts(frame))
+            before = pygame.image.tobytes(screen, "RGB")
+            new_info(screen, texts(frame))
+            assert pygame.image.tobytes(screen, "RGB") == before, (width, frame)
+
+        results = []
+        for name, step in (("full-screen layer", old_info), ("hud", new_info)):
+            hud = Hud(font, color, positions)
+            begin = time.perf_counter()
+            for frame in range(frames):
+                step(screen, texts(frame))
+            results.append((time.perf_counter() - begin) * 1000 / frames)
+        print(f"{width}x{height}: full-screen layer {results[0]:.3f} ms/frame, "
+              f"hud (with its screen clear) {results[1]:.3f} ms/frame, "
+              f"{hud.renders} renders in {frames} frames, {width * height * 4 / 2 ** 20:.1f} MiB layer no longer allocated")
@@ -5,14 +5,16 @@ import random
 import json
 import os
 from text import *
+from frames import scheduler
+from scenes import push, pop, replace, reset
+from runtime import register, clock
 from pygame.math import Vector2
 from pygame.locals import *
 
 pygame.init()
 
 def draw(text, font_size, y_position):
-  font = pygame.font.Font(None, font_size)
-  text_render = font.render(text, True, gray)
+  text_render = render(text, font_size, gray)
   text_rect = text_render.get_rect(center=(width // 2, y_position))
   screen.blit(text_render, text_rect)
 
@@ -44,7 +46,9 @@ def start_screen():
     else:
       write(screen, lead, "Leaderboard", 65, "black", "white", 10)
     
-    for event in pygame.event.get():
+    pygame.display.flip()
+    
+    for event in scheduler.events("lander.start_screen"):
       if event.type == pygame.QUIT:
         pygame.quit()
         sys.exit()
@@ -53,18 +57,14 @@ def start_screen():
           pygame.quit()
           sys.exit()
         elif event.key == pygame.K_RSHIFT:
-          login()
+          return replace(login)
       elif event.type == pygame.MOUSEBUTTONDOWN:
         if start.collidepoint(mouse_pos):
-          starter = False
-          cntdown()
+          return replace(cntdown)
         elif lead.collidepoint(mouse_pos):
-          starter = False
-          leaderboard_screen()
+          return push(leaderboard_screen)
         elif tutor.collidepoint(mouse_pos):
-          starter = False
-          tutorial()
-    pygame.display.flip()
+          return push(tutorial)
 
 def tutorial():
   running = True
@@ -92,7 +92,7 @@ def tutorial():
     
     pygame.display.flip()
     
-    for event in pygame.event.get():
+    for event in scheduler.events("lander.tutorial"):
       if event.type == pygame.QUIT:
         pygame.quit()
         sys.exit()
@@ -102,11 +102,9 @@ def tutorial():
           sys.exit()
       elif event.type == pygame.MOUSEBUTTONDOWN:
         if home.collidepoint(mouse_pos):
-          start = False
-          start_screen()
+          return pop()
         elif start.collidepoint(mouse_pos):
-          start = False
-          cntdown()
+          return reset(cntdown)
 
 def leaderboard_screen():
   lead = True
@@ -126,7 +124,7 @@ def leaderboard_screen():
     
     pygame.display.flip()
     
-    for event in pygame.event.get():
+    for event in scheduler.events("lander.leaderboard_screen"):
       if event.type == pygame.QUIT:
         pygame.quit()
         sys.exit()
@@ -136,8 +134,7 @@ def leaderboard_screen():
           sys.exit()
       elif event.type == pygame.MOUSEBUTTONDOWN:
         if home.collidepoint(mouse_pos):
-          lead = False
-          start_screen()
+          return pop()
 
 def login():
   global username
@@ -149,7 +146,19 @@ def login():
     
     draw("Rocket Lander", 100, height // 4)
     
-    for event in pygame.event.get():
+    name_surface = font.render(username, True, white)
+    name_rect = name_surface.get_rect()
+    name_rect.center = (width // 2, height // 2)
+    screen.blit(name_surface, name_rect)
+    
+    text_surface = font.render("Type Your Index No. : ", True, white)
+    text_rect = text_surface.get_rect()
+    text_rect.center = (width // 2, height // 2 - 80)
+    screen.blit(text_surface, text_rect)
+    
+    pygame.display.update()
+    
+    for event in scheduler.events("lander.login"):
       if event.type == pygame.QUIT:
         pygame.quit()
         sys.exit()
@@ -160,8 +169,7 @@ def login():
         elif event.key == pygame.K_RETURN:
           try:
             if username == "admin":
-              running = False
-              password_screen()
+              return replace(password_screen)
             elif 25000 <= int(username) <= 31000:
               running = False
             else:
@@ -175,20 +183,8 @@ def login():
           username = username[:-1]
         else:
           username += event.unicode
-    
-    name_surface = font.render(username, True, white)
-    name_rect = name_surface.get_rect()
-    name_rect.center = (width // 2, height // 2)
-    screen.blit(name_surface, name_rect)
-    
-    text_surface = font.render("Type Your Index No. : ", True, white)
-    text_rect = text_surface.get_rect()
-    text_rect.center = (width // 2, height // 2 - 80)
-    screen.blit(text_surface, text_rect)
-    
-    pygame.display.update()
   
-  start_screen()
+  return replace(start_screen)
   
 def password_screen():
   global me
@@ -199,7 +195,19 @@ def password_screen():
   
   while running:
     screen.fill(black)
-    for event in pygame.event.get():
+    pass_surface = font.render(hidden, True, white)
+    pass_rect = pass_surface.get_rect()
+    pass_rect.center = (width // 2, height // 2)
+    screen.blit(pass_surface, pass_rect)
+    
+    text_surface = font.render("Password", True, white)
+    text_rect = text_surface.get_rect()
+    text_rect.center = (width // 2, height // 2 - 80)
+    screen.blit(text_surface, text_rect)
+    
+    pygame.display.update()
+    
+    for event in scheduler.events("lander.password_screen"):
       if event.type == pygame.QUIT:
         pygame.quit()
         sys.exit()
@@ -214,8 +222,7 @@ def password_screen():
           else:
             password = ""
             hidden = ""
-            running = False
-            login()
+            return replace(login)
         elif event.key == pygame.K_BACKSPACE:
           password = password[:-1]
           hidden = hidden[:-1]
@@ -224,20 +231,8 @@ def password_screen():
         else:
           password += event.unicode
           hidden += '*'
-
-    pass_surface = font.render(hidden, True, white)
-    pass_rect = pass_surface.get_rect()
-    pass_rect.center = (width // 2, height // 2)
-    screen.blit(pass_surface, pass_rect)
-    
-    text_surface = font.render("Password", True, white)
-    text_rect = text_surface.get_rect()
-    text_rect.center = (width // 2, height // 2 - 80)
-    screen.blit(text_surface, text_rect)
-    
-    pygame.display.update()
   
-  start_screen()
+  return replace(start_screen)
     
 def wrong_area():
   global spaceship_pos, gravity, a, v1, v2, fuel, platform_pos, platform_ground1, platform_ground2
@@ -265,7 +260,7 @@ def wrong_area():
     
     pygame.display.flip()
     
-    for event in pygame.event.get():
+    for event in scheduler.events("lander.wrong_area"):
       if event.type == pygame.QUIT:
         pygame.quit()
         sys.exit()
@@ -275,11 +270,9 @@ def wrong_area():
           sys.exit()
       elif event.type == pygame.MOUSEBUTTONDOWN:
         if home.collidepoint(mouse_pos):
-          sad = False
-          start_screen()
+          return replace(start_screen)
         elif again.collidepoint(mouse_pos):
-          sad = False
-          cntdown()
+          return replace(cntdown)
 
 def win():
   yay = True
@@ -288,7 +281,7 @@ def win():
     draw("You Win!", 100, height // 2 - 250)
     
     if v1 <= 0:
-      lose()
+      return replace(lose)
     elif v1 <= 1.0:
       draw(f"Touchdown Softness: Prefect ({v1:.5f} m/s)", 100, height // 2)
     elif v1 <= 2.0:
@@ -314,7 +307,7 @@ def win():
     
     pygame.display.flip()
     
-    for event in pygame.event.get():
+    for event in scheduler.events("lander.win"):
       if event.type == pygame.QUIT:
         pygame.quit()
         sys.exit()
@@ -324,11 +317,9 @@ def win():
           sys.exit()
       elif event.type == pygame.MOUSEBUTTONDOWN:
         if home.collidepoint(mouse_pos):
-          yay = False
-          login()
+          return replace(login)
         elif again.collidepoint(mouse_pos):
-          yay = False
-          cntdown()
+          return replace(cntdown)
 
 def lose():
   global spaceship_pos, gravity, a, v1, v2, fuel, platform_pos, platform_ground1, platform_ground2
@@ -355,7 +346,7 @@ def lose():
     
     pygame.display.flip()
     
-    for event in pygame.event.get():
+    for event in scheduler.events("lander.lose"):
       if event.type == pygame.QUIT:
         pygame.quit()
         sys.exit()
@@ -365,11 +356,9 @@ def lose():
           sys.exit()
       elif event.type == pygame.MOUSEBUTTONDOWN:
         if home.collidepoint(mouse_pos):
-          sad = False
-          login()
+          return replace(login)
         elif again.collidepoint(mouse_pos):
-          sad = False
-          cntdown()
+          return replace(cntdown)
 
 def cntdown():
   global spaceship_pos, gravity, a, v1, v2, fuel, platform_pos, platform_ground1, platform_ground2
@@ -402,7 +391,7 @@ def cntdown():
       if event.key == pygame.K_ESCAPE:
         pygame.quit()
         sys.exit()
-  game()
+  return replace(game)
 
 def collide_line_line(p1, p2, p3, p4):
   def det(a, b):
@@ -528,8 +517,7 @@ def game():
           pygame.quit()
           sys.exit()
         elif event.key == pygame.K_LSHIFT:
-          gaming = False
-          start_screen()
+          return replace(start_screen)
     
     for star in stars:
       star['y'] += star['speed']
@@ -568,21 +556,20 @@ def game():
     
     if spaceship_pos[1] + 15 >= height:
       pygame.mouse.set_visible(1)
-      wrong_area()
-      gaming = False
+      return replace(wrong_area)
     
     if polygons_collide(spaceship_poly, ground):
       pygame.mouse.set_visible(1)
-      wrong_area()
+      return replace(wrong_area)
     
     if platform_pos[0] <= spaceship_pos[0] + 10 and spaceship_pos[0] <= platform_pos[0] + 20 and platform_pos[1] <= spaceship_pos[1] + 10 < platform_pos[1] + 5:
       pygame.mouse.set_visible(1)
       if v1 < 0:
         continue
       elif v1 <= 3.0:
-        win()
+        return replace(win)
       else:
-        lose()
+        return replace(lose)
     
     v1 += gravity / fps
     spaceship_pos[1] += v1
@@ -663,7 +650,6 @@ def game():
 display_info = pygame.display.Info()
 width, height = display_info.current_w, display_info.current_h
 fps = 60
-clock = pygame.time.Clock()
 
 black = (0, 0, 0)
 white = (255, 255, 255)
@@ -672,7 +658,6 @@ gray = (200, 200, 200)
 orange = (255, 165, 0)
 light_blue = (173, 116, 233)
 
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption('Rocket Lander')
-font = pygame.font.Font(None, 36)
+screen = register('Rocket Lander')
+font = get_font(36)
   
\ No newline at end of file
@@ -1,29 +1,43 @@
+import time
+startup_start = time.perf_counter()
 import pygame
 import sys
-import time
 import random
+import importlib
 from text import *
-from BouncingBall import *
-from lander import login
-from yazy import player_init
-from ShootingGame import shooting_game
+from scenes import run
+from runtime import register, clock
+
+# Games are only imported once picked, Yazy alone pulls in qiskit and the
+# simulator which used to hold up the menu for seconds.
+games = [("BouncingBall", "bounce"), 
+         ("lander", "login"), 
+         ("yazy", "player_init"), 
+         ("ShootingGame", "shooting_game")]
+
+def launch(index):
+  module_name, entry = games[index]
+  module = importlib.import_module(module_name)
+  run(getattr(module, entry))
+  register('Games')
+
+# python main.py --startup-time prints time to first menu frame and exits
+measure_startup = "--startup-time" in sys.argv
 
 pygame.init()
 
 display_info = pygame.display.Info()
 width, height = display_info.current_w, display_info.current_h
 fps = 100
-clock = pygame.time.Clock()
 
 black = (0, 0, 0)
 white = (255, 255, 255)
 gray = (200, 200, 200)
 
-screen = pygame.display.set_mode((width ,height))
+screen = register('Games')
 
 def draw(text, font_size, y_position):
-  font = pygame.font.Font(None, font_size)
-  text_render = font.render(text, True, gray)
+  text_render = render(text, font_size, gray)
   text_rect = text_render.get_rect(center=(width // 2, y_position))
   screen.blit(text_render, text_rect)
 
@@ -35,7 +49,7 @@ item_text = white
 item_hover = (100, 100, 100)
 border = (180, 180, 180)
 
-font = pygame.font.SysFont(None, 50)
+font = get_font(50)
 
 items = ["Bouncing Ball", 
           "Lander", 
@@ -183,14 +197,7 @@ def main():
               
               if item_rect.collidepoint(event.pos):
                 selected_index = start_index + i
-                if selected_index == 0:
-                  bounce()
-                elif selected_index == 1:
-                  login()
-                elif selected_index == 2:
-                  player_init()
-                elif selected_index == 3:
-                  shooting_game()
+                launch(selected_index)
                 break
       elif event.type == pygame.MOUSEBUTTONUP:
         if event.button == 1:
@@ -209,6 +216,10 @@ def main():
           update_slider_position_from_scroll()
     
     pygame.display.flip()
+    if measure_startup:
+      print(f"Time to first frame: {(time.perf_counter() - startup_start) * 1000:.1f} ms")
+      pygame.quit()
+      sys.exit()
     clock.tick(fps)
 
 main()
\ No newline at end of file
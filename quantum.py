@@ -1,19 +1,58 @@
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from collections import deque, OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import math
 import time
+import os
 
-backend = AerSimulator()
-max_qubits = backend.configuration().n_qubits
+# qiskit is only imported and the simulator only built the first time the
+# aer source actually needs it, so other entropy sources start instantly.
+backend = None
+max_qubits = None
+backend_lock = threading.Lock()
 
-def batch_quantum_bits(num_bits, num_rolls):
-  total_qubits = num_bits * num_rolls
+def aer_backend():
+  global backend, max_qubits
+  with backend_lock:
+    if backend is None:
+      from qiskit_aer import AerSimulator
+      backend = AerSimulator()
+      max_qubits = backend.configuration().n_qubits
+  return backend
+
+# Transpiled circuits keyed by qubit count, least recently used dropped first
+circuit_cache = OrderedDict()
+circuit_cache_size = 32
+circuit_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+circuit_cache_lock = threading.Lock()
+
+def compiled_circuit_for(total_qubits):
+  with circuit_cache_lock:
+    if total_qubits in circuit_cache:
+      circuit_cache.move_to_end(total_qubits)
+      circuit_cache_stats["hits"] += 1
+      return circuit_cache[total_qubits]
+    circuit_cache_stats["misses"] += 1
+
+  from qiskit import QuantumCircuit, transpile
   qc = QuantumCircuit(total_qubits, total_qubits)
   qc.h(range(total_qubits))
   qc.measure(range(total_qubits), range(total_qubits))
+  compiled_circuit = transpile(qc, aer_backend(), optimization_level=3)
+
+  with circuit_cache_lock:
+    circuit_cache[total_qubits] = compiled_circuit
+    circuit_cache.move_to_end(total_qubits)
+    while len(circuit_cache) > circuit_cache_size:
+      circuit_cache.popitem(last=False)
+      circuit_cache_stats["evictions"] += 1
+  return compiled_circuit
 
-  compiled_circuit = transpile(qc, backend, optimization_level=3)
-  job = backend.run(compiled_circuit, shots=1)
+def batch_quantum_bits(num_bits, num_rolls):
+  total_qubits = num_bits * num_rolls
+  compiled_circuit = compiled_circuit_for(total_qubits)
+  job = aer_backend().run(compiled_circuit, shots=1)
   result = job.result()
   counts = result.get_counts()
 
@@ -24,25 +63,254 @@ def batch_quantum_bits(num_bits, num_rolls):
   rolls = [int(bits, 2) for bits in rolls_bits]
   return rolls
 
-def quantum_random_numbers(max_value, num_rolls):
+# One job with many shots, memory=True gives every shot's bitstring back
+# instead of a collapsed counts dict, so a single run yields shots * qubits bits.
+max_shots_per_job = 4096
+
+def multi_shot_bits(shots):
+  aer_backend()
+  compiled_circuit = compiled_circuit_for(max_qubits)
+  job = backend.run(compiled_circuit, shots=shots, memory=True)
+  memory = job.result().get_memory()
+  return "".join(bitstring[::-1] for bitstring in memory)
+
+def quantum_bit_stream(shots=max_shots_per_job):
+  shots = max(1, min(shots, max_shots_per_job))
+  while True:
+    yield from multi_shot_bits(shots)
+
+# Fast Dice Roller (Lumbroso 2013): keeps the unused part of the range
+# between draws instead of throwing whole values away, so a roll costs
+# about log2(n) + 1 bits on average and every result in 0..n-1 is equally likely.
+def fast_dice_roll(bits, n):
+  if n == 1:
+    return 0
+  v, c = 1, 0
+  while True:
+    v = v << 1
+    c = (c << 1) | (next(bits) == "1")
+    if v >= n:
+      if c < n:
+        return c
+      v -= n
+      c -= n
+
+def quantum_random_numbers(max_value, num_rolls, multi_shot=True):
   num_bits = math.ceil(math.log2(max_value))
   results = []
+  aer_backend()
+
+  if multi_shot:
+    # Ask for a few more bits than the expected cost so one job is usually enough
+    bits = quantum_bit_stream(math.ceil((num_bits + 2) * num_rolls / max_qubits))
+    while len(results) < num_rolls:
+      results.append(fast_dice_roll(bits, max_value) + 1)
+    return results
+
   max_rolls_per_batch = max_qubits // num_bits
 
   while len(results) < num_rolls:
     batch_size = min(max_rolls_per_batch, num_rolls - len(results))
     batch = batch_quantum_bits(num_bits, batch_size)
-    batch_filtered = [n for n in batch if 1 <= n <= max_value]
+    batch_filtered = [n + 1 for n in batch if n < max_value]
     results.extend(batch_filtered)
 
   return results[:num_rolls]
 
+def counted_bits(bits, used):
+  for bit in bits:
+    used[0] += 1
+    yield bit
+
+# Bits spent per roll for the fast dice roller against the old fixed-width
+# rejection, for every die size in sides. Any bit stream works since the cost
+# only depends on how many bits are read, e.g. pass a secrets based one to
+# skip the simulator.
+def bits_per_roll_report(sides=range(2, 101), num_rolls=2000, bits=None):
+  if bits is None:
+    bits = quantum_bit_stream()
+  report = []
+  for n in sides:
+    used = [0]
+    stream = counted_bits(bits, used)
+    for _ in range(num_rolls):
+      fast_dice_roll(stream, n)
+    fast = used[0] / num_rolls
+
+    num_bits = math.ceil(math.log2(n))
+    used = [0]
+    stream = counted_bits(bits, used)
+    for _ in range(num_rolls):
+      while int("".join(islice(stream, num_bits)), 2) >= n:
+        pass
+    rejection = used[0] / num_rolls
+
+    report.append((n, math.log2(n), fast, rejection))
+  return report
+
 def roll_quantum_dice(sides=6, num_rolls=10):
   return quantum_random_numbers(sides, num_rolls)[0]
 
+# Entropy sources: anything with roll(sides, num_rolls) -> list of 1..sides.
+# Pick one with QUANTUM_ENTROPY=aer|secrets|pcg (and QUANTUM_SEED for pcg),
+# so load tests and CI can run Yazy without qiskit.
+class AerEntropy:
+  name = "aer"
+
+  def __init__(self, seed=None):
+    aer_backend()
+
+  def roll(self, sides, num_rolls):
+    return quantum_random_numbers(sides, num_rolls)
+
+class SecretsEntropy:
+  name = "secrets"
+
+  def __init__(self, seed=None):
+    from text import randint
+    self.randint = randint
+
+  def roll(self, sides, num_rolls):
+    return [self.randint(1, sides) for _ in range(num_rolls)]
+
+class PcgEntropy:
+  name = "pcg"
+
+  def __init__(self, seed=None):
+    import numpy as np
+    self.rng = np.random.Generator(np.random.PCG64(seed))
+
+  def roll(self, sides, num_rolls):
+    return self.rng.integers(1, sides + 1, size=num_rolls).tolist()
+
+entropy_sources = {"aer": AerEntropy, "secrets": SecretsEntropy, "pcg": PcgEntropy}
+entropy = None
+
+def set_entropy_source(name, seed=None):
+  global entropy
+  if name not in entropy_sources:
+    raise ValueError(f"Unknown entropy source {name!r}, expected one of {', '.join(entropy_sources)}")
+  entropy = entropy_sources[name](seed)
+  with pool_lock:
+    for values in dice_pool.values():
+      values.clear()
+  return entropy
+
+def entropy_source():
+  if entropy is None:
+    seed = os.environ.get("QUANTUM_SEED")
+    set_entropy_source(os.environ.get("QUANTUM_ENTROPY", "aer"), int(seed) if seed else None)
+  return entropy
+
+# Dice pool: values are harvested in big blocks on a worker thread so the
+# game loop only ever pops from a deque.
+pool_size = 300
+pool_low_water = 60
+dice_pool = {}
+pool_refilling = set()
+pool_errors = {}
+pool_lock = threading.Lock()
+pool_ready = threading.Condition(pool_lock)
+
+def fill_dice_pool(sides):
+  values = []
+  try:
+    values = entropy_source().roll(sides, pool_size)
+  except Exception as e:
+    pool_errors[sides] = e
+    raise
+  finally:
+    with pool_lock:
+      dice_pool.setdefault(sides, deque()).extend(values)
+      pool_refilling.discard(sides)
+      pool_ready.notify_all()
+
+# Must be called with pool_lock held
+def start_refill(sides):
+  if sides in pool_refilling:
+    return
+  pool_refilling.add(sides)
+  threading.Thread(target=fill_dice_pool, args=(sides,), daemon=True).start()
+
+def refill_dice_pool(sides=6):
+  with pool_lock:
+    start_refill(sides)
+
+def draw_quantum_dice(sides=6):
+  with pool_lock:
+    values = dice_pool.setdefault(sides, deque())
+    if len(values) <= pool_low_water:
+      start_refill(sides)
+    # Only a draw right after startup can find the pool empty; wait for the
+    # refill that is already running rather than going to the simulator here.
+    while not values:
+      if sides in pool_errors:
+        raise pool_errors.pop(sides)
+      start_refill(sides)
+      pool_ready.wait()
+    return values.popleft()
+
+refill_dice_pool(6)
+
+# Turn prefetch: while a Yazy player is still choosing a category the next
+# turn's dice (3 rolls of 5) are generated on a worker, so the first Roll
+# click only pops values that already exist.
+turn_dice = {}
+turn_pending = {}
+prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dice-prefetch")
+prefetch_stats = {"jobs": 0, "values": 0, "latency_total": 0.0, "latency_last": 0.0, "latency_max": 0.0, "misses": 0}
+
+def generate_turn_dice(sides, count):
+  begin = time.perf_counter()
+  values = []
+  try:
+    values = entropy_source().roll(sides, count)
+  finally:
+    latency = time.perf_counter() - begin
+    with pool_lock:
+      turn_dice.setdefault(sides, deque()).extend(values)
+      turn_pending[sides] -= count
+      prefetch_stats["jobs"] += 1
+      prefetch_stats["values"] += len(values)
+      prefetch_stats["latency_total"] += latency
+      prefetch_stats["latency_last"] = latency
+      prefetch_stats["latency_max"] = max(prefetch_stats["latency_max"], latency)
+
+def prefetch_turn(sides=6, count=15):
+  with pool_lock:
+    needed = count - len(turn_dice.get(sides, ())) - turn_pending.get(sides, 0)
+    if needed <= 0:
+      return
+    turn_pending[sides] = turn_pending.get(sides, 0) + needed
+  prefetch_executor.submit(generate_turn_dice, sides, needed)
+
+def draw_turn_dice(sides=6):
+  with pool_lock:
+    values = turn_dice.get(sides)
+    if values:
+      return values.popleft()
+    prefetch_stats["misses"] += 1
+  return draw_quantum_dice(sides)
+
+def prefetch_report():
+  with pool_lock:
+    jobs = prefetch_stats["jobs"]
+    return {"queue_depth": {sides: len(values) for sides, values in turn_dice.items()}, 
+            "pending": dict(turn_pending), 
+            "jobs": jobs, 
+            "misses": prefetch_stats["misses"], 
+            "latency_last": prefetch_stats["latency_last"], 
+            "latency_mean": prefetch_stats["latency_total"] / jobs if jobs else 0.0, 
+            "latency_max": prefetch_stats["latency_max"]}
+
 # start = time.time()
 # results = roll_quantum_dice(sides=6, num_rolls=5)
 # end = time.time()
 
 # print("Quantum dice rolls:", results)
 # print(f"Execution time: {end - start:.4f} seconds")
+
+if __name__ == "__main__":
+  print(" n  log2(n)  fast  rejection")
+  for n, ideal, fast, rejection in bits_per_roll_report():
+    print(f"{n:3} {ideal:7.3f} {fast:6.3f} {rejection:9.3f}")
@@ -0,0 +1,121 @@
+import pygame
+import time
+import os
+
+# Everything the games share: one display surface, one clock, the font cache
+# and the image cache. A game calls register() instead of set_mode(), so
+# going from the menu into a game (and back) reuses the surface that is
+# already up instead of tearing down and rebuilding the full-screen window.
+screen = None
+fullscreen = False
+current = None
+clock = pygame.time.Clock()
+fonts = {}
+images = {}
+# (path, alpha) -> [bytes held, seconds spent loading and converting]
+image_stats = {}
+runtime_stats = {"mode_sets": 0, "registrations": 0, "font_loads": 0, "image_loads": 0}
+base_dir = os.path.dirname(os.path.abspath(__file__))
+
+def display(flags=0):
+  global screen, fullscreen
+  want_full = bool(flags & pygame.FULLSCREEN)
+  surface = pygame.display.get_surface()
+  # Somebody else (a test harness) already opened a window, use it
+  if screen is None and surface is not None:
+    screen = surface
+    fullscreen = bool(surface.get_flags() & pygame.FULLSCREEN)
+  if screen is None or surface is None or want_full != fullscreen:
+    if not pygame.get_init():
+      pygame.init()
+    size = pygame.display.get_desktop_sizes()[0]
+    screen = pygame.display.set_mode(size, flags)
+    fullscreen = want_full
+    runtime_stats["mode_sets"] += 1
+  return screen
+
+def register(title, flags=0):
+  global current
+  surface = display(flags)
+  if current != title:
+    pygame.display.set_caption(title)
+    current = title
+  runtime_stats["registrations"] += 1
+  return surface
+
+def get_font(font_size):
+  font = fonts.get(font_size)
+  if font is None:
+    font = fonts[font_size] = pygame.font.Font(None, font_size)
+    runtime_stats["font_loads"] += 1
+  return font
+
+# Images by path, relative paths are looked up next to the games. Surfaces
+# come back in the display's pixel format so blits are plain copies, and
+# alpha asks for a variant with that overall opacity baked into the pixels
+# instead of a surface alpha that gets blended in again on every blit.
+def image(path, alpha=None):
+  key = (path, alpha)
+  surface = images.get(key)
+  if surface is not None:
+    return surface
+
+  base = image(path) if alpha is not None else None
+  begin = time.perf_counter()
+  if base is None:
+    full = path if os.path.isabs(path) else os.path.join(base_dir, path)
+    surface = pygame.image.load(full)
+    runtime_stats["image_loads"] += 1
+    if pygame.display.get_surface() is not None:
+      surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+  else:
+    surface = base.copy()
+    if not surface.get_flags() & pygame.SRCALPHA:
+      surface = surface.convert_alpha()
+    surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+  images[key] = surface
+  image_stats[key] = [surface.get_pitch() * surface.get_height(), time.perf_counter() - begin]
+  return surface
+
+def image_report():
+  lines = []
+  for (path, alpha), (size, seconds) in image_stats.items():
+    variant = "" if alpha is None else f" alpha {alpha}"
+    lines.append(f"{path}{variant}: {size / 1024:.0f} KiB, {seconds * 1000:.2f} ms")
+  lines.append(f"{len(images)} images, {sum(s[0] for s in image_stats.values()) / 1024:.0f} KiB held")
+  return "\n".join(lines)
+
+def report():
+  return (f"{runtime_stats['mode_sets']} display mode sets for {runtime_stats['registrations']} registrations, "
+          f"{len(fonts)} fonts, {len(images)} images")
+
+if __name__ == "__main__":
+  os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+  pygame.init()
+  switches = 50
+  size = pygame.display.get_desktop_sizes()[0]
+  begin = time.perf_counter()
+  for i in range(switches):
+    pygame.display.set_mode(size)
+    pygame.display.set_caption(f"game {i % 4}")
+  before = time.perf_counter() - begin
+  begin = time.perf_counter()
+  for i in range(switches):
+    register(f"game {i % 4}")
+  after = time.perf_counter() - begin
+  print(f"{switches} game switches at {size[0]}x{size[1]}: set_mode {before * 1000 / switches:.3f} ms each, "
+        f"register {after * 1000 / switches:.3f} ms each")
+  print(report())
+
+  # ShootingGame's logo, blitted the old way and from the cache
+  frames = 2000
+  screen = display()
+  old = pygame.image.load(os.path.join(base_dir, "school_logo.png"))
+  old.set_alpha(128)
+  new = image("school_logo.png", 128)
+  for name, logo in (("load + set_alpha", old), ("image(path, 128)", new)):
+    begin = time.perf_counter()
+    for _ in range(frames):
+      screen.blit(logo, (0, 0))
+    print(f"{name:18} {(time.perf_counter() - begin) * 1e6 / frames:7.1f} us per blit")
+  print(image_report())
@@ -0,0 +1,45 @@
+import os
+import sys
+
+# Screens are plain functions. Instead of calling the next screen, which
+# nests another Python frame (and keeps the old screen's locals alive) on
+# every visit, a screen returns a transition and run() applies it, so a
+# kiosk can go round the screens forever on a flat stack.
+max_depth = 8
+scene_stats = {"transitions": 0, "max_depth": 0}
+
+def push(scene, *args):
+  return ("push", scene, args)
+
+def replace(scene, *args):
+  return ("replace", scene, args)
+
+# Drop everything underneath, for flows that leave a menu for good
+def reset(scene, *args):
+  return ("reset", scene, args)
+
+def pop():
+  return ("pop", None, ())
+
+# A screen that returns nothing is done, same as pop(). A popped-to screen
+# starts over with the arguments it was pushed with.
+def run(scene, *args):
+  stack = [(scene, args)]
+  while stack:
+    scene, args = stack[-1]
+    transition = scene(*args)
+    op, scene, args = transition if transition is not None else pop()
+    if op == "pop":
+      stack.pop()
+    elif op == "push":
+      stack.append((scene, args))
+    elif op == "replace":
+      stack[-1] = (scene, args)
+    elif op == "reset":
+      stack[:] = [(scene, args)]
+    else:
+      raise ValueError(f"Unknown scene transition {op!r}")
+    if len(stack) > max_depth:
+      raise RuntimeError(f"Scene stack is {len(stack)} deep: {', '.join(s.__name__ for s, _ in stack)}")
+    scene_stats["transitions"] += 1
+    scene_stats["max_depth"] = max(scene_stats["max_depth"], len(stack))
@@ -0,0 +1,108 @@
+from itertools import combinations_with_replacement, product
+
+# Score slots as used by yazy.start(): 0 is unused, 1-6 are the upper section
+row_3 = 7
+row_4 = 8
+b25 = 9
+b40 = 10
+b50 = 11
+categories = 12
+
+empty_scores = (0,) * categories
+
+def compute_scores(hand):
+  amount = [0] * 7
+  for value in hand:
+    amount[value] += 1
+  total = sum(hand)
+
+  scores = [0] * categories
+  for face in range(1, 7):
+    scores[face] = amount[face] * face
+  # Three and four of a kind only look at faces 1-5, same as the board always has
+  if max(amount[1:6]) >= 3:
+    scores[row_3] = total
+  if max(amount[1:6]) >= 4:
+    scores[row_4] = total
+  if amount.count(2) == 1 and amount.count(3) == 1:
+    scores[b25] = 25
+  ordered = sorted(hand)
+  if all(ordered[i] == ordered[i - 1] + 1 for i in range(1, 5)):
+    scores[b40] = 40
+  if amount[hand[0]] == 5:
+    scores[b50] = 50
+  return tuple(scores)
+
+# Every sorted hand of five dice, only 252 of them cover all 7776 rolls
+score_table = {hand: compute_scores(hand) for hand in combinations_with_replacement(range(1, 7), 5)}
+
+def hand_scores(dice):
+  return score_table[tuple(sorted(dice))]
+
+# The original per-frame scoring from yazy.start(), die[0] unused
+def reference_scores(die):
+  score = [0] * categories
+  for k in range(1, 7):
+    for i in range(1, 6):
+      if int(die[i]) == k:
+        score[k] += k
+
+  amount = [0 for _ in range(6)]
+  for i in range(1, 6):
+    for j in range(1, 6):
+      if die[j] == i:
+        amount[i] += 1
+    if amount[i] >= 3:
+      for j in range(1, 6):
+        score[row_3] += die[j]
+      break
+
+  amount = [0 for _ in range(6)]
+  for i in range(1, 6):
+    for j in range(1, 6):
+      if die[j] == i:
+        amount[i] += 1
+    if amount[i] >= 4:
+      for j in range(1, 6):
+        score[row_4] += die[j]
+      break
+
+  amount = [0 for _ in range(7)]
+  two = 0
+  three = 0
+  for i in range(1, 7):
+    for j in range(1, 6):
+      if die[j] == i:
+        amount[i] += 1
+    if amount[i] == 2:
+      two += 1
+    elif amount[i] == 3:
+      three += 1
+  if two == 1 and three == 1:
+    score[b25] = 25
+
+  sorted_die = sorted(die)
+  consectutive = True
+  for i in range(2, 6):
+    if sorted_die[i] != sorted_die[i - 1] + 1:
+      consectutive = False
+  if consectutive:
+    score[b40] = 40
+
+  if die[1] == die[2] == die[3] == die[4] == die[5]:
+    score[b50] = 50
+  return tuple(score)
+
+# Checks the table against the original scoring for all 6^5 ordered rolls
+def check_table():
+  mismatches = []
+  for dice in product(range(1, 7), repeat=5):
+    if hand_scores(dice) != reference_scores([0] + list(dice)):
+      mismatches.append(dice)
+  return mismatches
+
+if __name__ == "__main__":
+  mismatches = check_table()
+  print(f"{len(score_table)} hands, {6 ** 5} rolls checked, {len(mismatches)} mismatches")
+  for dice in mismatches[:10]:
+    print(dice, hand_scores(dice), reference_scores([0] + list(dice)))
@@ -0,0 +1,78 @@
+import numpy as np
+
+# Uniform spatial hash over the screen. Every frame the items are bucketed by
+# the cell their point falls in (a counting sort: cell ids are small ints, so
+# NumPy's stable argsort is a radix sort), and a query only gathers the
+# items of the cells a box overlaps, one contiguous slice per row of cells.
+class SpatialGrid:
+
+    def __init__(self, width, height, cell):
+        self.cell = cell
+        self.cols = int(width // cell) + 1
+        self.rows = int(height // cell) + 1
+        cells = self.cols * self.rows
+        self.dtype = np.int16 if cells < 2 ** 15 else np.int32
+        self.order = np.empty(0, dtype=np.intp)
+        self.starts = np.zeros(cells + 1, dtype=np.intp)
+
+    # Points off the screen go to the nearest edge cell
+    def cell_of(self, xs, ys):
+        ix = np.clip(np.asarray(xs) // self.cell, 0, self.cols - 1).astype(self.dtype)
+        iy = np.clip(np.asarray(ys) // self.cell, 0, self.rows - 1).astype(self.dtype)
+        return iy * self.dtype(self.cols) + ix
+
+    def build(self, xs, ys):
+        cells = self.cell_of(xs, ys)
+        self.order = np.argsort(cells, kind="stable")
+        np.cumsum(np.bincount(cells, minlength=self.cols * self.rows), out=self.starts[1:])
+
+    # Indices of every item bucketed in a cell the box touches
+    def query(self, x0, y0, x1, y1):
+        c0 = min(max(int(x0 // self.cell), 0), self.cols - 1)
+        c1 = min(max(int(x1 // self.cell), 0), self.cols - 1)
+        r0 = min(max(int(y0 // self.cell), 0), self.rows - 1)
+        r1 = min(max(int(y1 // self.cell), 0), self.rows - 1)
+        parts = []
+        for row in range(r0, r1 + 1):
+            first = self.starts[row * self.cols + c0]
+            last = self.starts[row * self.cols + c1 + 1]
+            if last > first:
+                parts.append(self.order[first:last])
+        if not parts:
+            return self.order[:0]
+        return np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+
+if __name__ == "__main__":
+    import time
+    from collision import segment_circle_hits
+
+    # Grid query against the brute-force check on random bullets
+    width, height = 1920, 1080
+    line_len = width * 0.06
+    px, py, r = width / 2, height / 2, width * 0.02
+    rng = np.random.default_rng(2)
+    grid = SpatialGrid(width, height, 128)
+    print(f"{'bullets':>8} {'brute ms':>9} {'grid ms':>8} {'candidates':>11}")
+    for count in (100, 1000, 10000, 100000):
+        x0 = rng.uniform(0, width, count)
+        y0 = rng.uniform(0, height, count)
+        bearing = rng.uniform(0, 2 * np.pi, count)
+        x1 = x0 + np.cos(bearing) * line_len
+        y1 = y0 - np.sin(bearing) * line_len
+        frames = max(20, 200000 // count)
+
+        begin = time.perf_counter()
+        for _ in range(frames):
+            brute = segment_circle_hits(px, py, r, x0, y0, x1, y1)
+        brute_ms = (time.perf_counter() - begin) * 1000 / frames
+
+        begin = time.perf_counter()
+        for _ in range(frames):
+            grid.build(x0, y0)
+            near = grid.query(px - r - line_len, py - r - line_len, px + r + line_len, py + r + line_len)
+            hits = segment_circle_hits(px, py, r, x0[near], y0[near], x1[near], y1[near])
+        grid_ms = (time.perf_counter() - begin) * 1000 / frames
+
+        assert sorted(near[hits].tolist()) == np.flatnonzero(brute).tolist()
+        print(f"{count:8} {brute_ms:9.3f} {grid_ms:8.3f} {len(near):11}")
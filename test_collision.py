@@ -0,0 +1,91 @@
+from math import sqrt
+import numpy as np
+import pytest
+from collision import itlc, segment_circle_hits
+
+
+# Random segments against one circle: around it, far away, tangent to it,
+# through its centre, very long and zero length
+def random_cases(rng, n):
+    cx, cy = rng.uniform(-1000, 1000, 2)
+    r = rng.choice([rng.uniform(0.5, 5), rng.uniform(5, 100), rng.uniform(100, 2000)])
+    spread = rng.choice([r * 0.5, r * 2, r * 10, 1e5])
+    x1 = cx + rng.uniform(-spread, spread, n)
+    y1 = cy + rng.uniform(-spread, spread, n)
+    x2 = cx + rng.uniform(-spread, spread, n)
+    y2 = cy + rng.uniform(-spread, spread, n)
+    through = rng.random(n) < 0.1
+    x2[through], y2[through] = 2 * cx - x1[through], 2 * cy - y1[through]
+    tangent = rng.random(n) < 0.1
+    angle = rng.uniform(0, 2 * np.pi, n)
+    tx, ty = cx + r * np.cos(angle), cy + r * np.sin(angle)
+    length = spread * rng.uniform(0.01, 1, n)
+    x1[tangent] = (tx - length * np.sin(angle))[tangent]
+    y1[tangent] = (ty + length * np.cos(angle))[tangent]
+    x2[tangent] = (tx + length * np.sin(angle))[tangent]
+    y2[tangent] = (ty - length * np.cos(angle))[tangent]
+    return cx, cy, r, x1, y1, x2, y2
+
+
+# Rounding can only make the two disagree where the answer sits on a knife
+# edge: the discriminant is zero to within float precision (itlc squares
+# with pow(), NumPy multiplies) or a root lands right on a segment end
+def borderline(cx, cy, r, x1, y1, x2, y2):
+    dx = x2 - x1
+    dy = y2 - y1
+    a = dx * dx + dy * dy
+    b = 2 * (dx * (x1 - cx) + dy * (y1 - cy))
+    c = (x1 - cx) ** 2 + (y1 - cy) ** 2 - r * r
+    D = b * b - 4 * a * c
+    if abs(D) <= 1e-9 * max(b * b, abs(4 * a * c)):
+        return True
+    sqrtD = sqrt(max(D, 0))
+    roots = ((-b - sqrtD) / (2 * a), (-b + sqrtD) / (2 * a))
+    return any(abs(t) < 1e-9 or abs(t - 1) < 1e-9 for t in roots)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_itlc_on_random_segments(seed):
+    rng = np.random.default_rng(seed)
+    mismatches = []
+    for _ in range(25):
+        cx, cy, r, x1, y1, x2, y2 = random_cases(rng, 1000)
+        fast = segment_circle_hits(cx, cy, r, x1, y1, x2, y2)
+        for i in range(len(x1)):
+            # itlc divides by zero on these, they have their own test
+            if x1[i] == x2[i] and y1[i] == y2[i]:
+                continue
+            case = (cx, cy, r, x1[i], y1[i], x2[i], y2[i])
+            if fast[i] != itlc(*case) and not borderline(*case):
+                mismatches.append(case)
+    assert mismatches == []
+
+
+def test_matches_itlc_on_arrays_of_any_shape():
+    rng = np.random.default_rng(7)
+    x1, y1, x2, y2 = (rng.uniform(0, 100, (20, 30)) for _ in range(4))
+    hits = segment_circle_hits(50, 50, 10, x1, y1, x2, y2)
+    assert hits.shape == (20, 30)
+    for i, j in np.ndindex(hits.shape):
+        case = (50, 50, 10, x1[i, j], y1[i, j], x2[i, j], y2[i, j])
+        assert hits[i, j] == itlc(*case) or borderline(*case)
+
+
+def test_no_segments():
+    empty = np.empty(0)
+    assert segment_circle_hits(0, 0, 5, empty, empty, empty, empty).tolist() == []
+
+
+# A point only hits when it sits on the edge, inside or outside does not
+@pytest.mark.parametrize("x, y, hit", [
+    (3.0, 4.0, True),
+    (0.0, 5.0, True),
+    (-5.0, 0.0, True),
+    (0.0, 0.0, False),
+    (1.0, 1.0, False),
+    (6.0, 0.0, False),
+    (100.0, -3.0, False),
+])
+def test_zero_length_segments(x, y, hit):
+    with np.errstate(all="raise"):
+        assert segment_circle_hits(0.0, 0.0, 5.0, [x], [y], [x], [y]).tolist() == [hit]
@@ -0,0 +1,92 @@
+import os
+import tracemalloc
+import pygame
+import pytest
+from scenes import push, replace, pop, run, scene_stats
+
+
+def test_stack_deeper_than_max_depth_raises():
+  def deeper(n):
+    return push(deeper, n + 1)
+
+  with pytest.raises(RuntimeError):
+    run(deeper, 0)
+
+
+def test_pop_restarts_the_screen_underneath():
+  visited = []
+
+  def menu(visit):
+    visited.append(("menu", visit))
+    return push(sub) if ("back",) not in visited else None
+
+  def sub():
+    visited.append(("sub",))
+    return replace(back)
+
+  def back():
+    visited.append(("back",))
+    return pop()
+
+  run(menu, 0)
+  assert visited == [("menu", 0), ("sub",), ("back",), ("menu", 0)]
+
+
+# Drives the real lander menus (start screen -> leaderboard -> back ->
+# tutorial -> back ...) by posting clicks, and checks the stack depth and
+# allocated memory stay flat over 10,000 transitions.
+def test_soak_lander_menus(monkeypatch):
+  transitions, warmup = 10000, 1000
+  monkeypatch.setenv("SDL_VIDEODRIVER", os.environ.get("SDL_VIDEODRIVER", "dummy"))
+  pygame.init()
+  pygame.display.set_mode((1280, 720))
+  import lander
+  from frames import scheduler
+  monkeypatch.setattr(lander, "width", 1280)
+  monkeypatch.setattr(lander, "height", 720)
+  monkeypatch.setitem(scene_stats, "transitions", 0)
+  monkeypatch.setitem(scene_stats, "max_depth", 0)
+  w, h = lander.width // 2, lander.height // 2
+  route = {
+    "lander.start_screen": [(w, h + 325), (w, h + 200)],
+    "lander.leaderboard_screen": [(w, h + 200)],
+    "lander.tutorial": [(w, h + 300)],
+  }
+  visits = {name: 0 for name in route}
+  target = [(0, 0)]
+  seen = [None, 0]
+  samples = []
+  events = scheduler.events
+
+  class SoakDone(Exception):
+    pass
+
+  # First frame of a screen only aims the mouse, the next one clicks
+  def scripted(name, animating=False):
+    if seen[0] != name or seen[1] != scene_stats["transitions"]:
+      seen[0], seen[1] = name, scene_stats["transitions"]
+      targets = route[name]
+      target[0] = targets[visits[name] % len(targets)]
+      visits[name] += 1
+      if scene_stats["transitions"] >= warmup and not samples:
+        samples.append(tracemalloc.get_traced_memory()[0])
+      return []
+    if scene_stats["transitions"] >= transitions:
+      raise SoakDone
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=target[0], button=1))
+    return events(name, animating)
+
+  monkeypatch.setattr(scheduler, "events", scripted)
+  monkeypatch.setattr(pygame.mouse, "get_pos", lambda: target[0])
+
+  tracemalloc.start()
+  try:
+    with pytest.raises(SoakDone):
+      run(lander.start_screen)
+    end = tracemalloc.get_traced_memory()[0]
+  finally:
+    tracemalloc.stop()
+
+  assert scene_stats["transitions"] == transitions
+  assert scene_stats["max_depth"] <= 2
+  assert end - samples[0] < 256 * 1024
@@ -0,0 +1,44 @@
+import pytest
+from scoring import *
+
+def test_table_matches_reference_for_every_roll():
+  assert check_table() == []
+
+def test_table_covers_every_sorted_hand():
+  assert len(score_table) == 252
+
+@pytest.mark.parametrize("dice, face, score", [
+  ((1, 1, 2, 3, 6), 1, 2),
+  ((1, 1, 2, 3, 6), 2, 2),
+  ((1, 1, 2, 3, 6), 3, 3),
+  ((1, 1, 2, 3, 6), 4, 0),
+  ((5, 5, 5, 1, 2), 5, 15),
+  ((6, 2, 6, 6, 6), 6, 24),
+])
+def test_upper_section(dice, face, score):
+  assert hand_scores(dice)[face] == score
+
+@pytest.mark.parametrize("dice, slot, score", [
+  ((3, 3, 3, 4, 5), row_3, 18),
+  ((3, 3, 4, 4, 5), row_3, 0),
+  # The board never counted sixes for three or four of a kind
+  ((6, 6, 6, 1, 2), row_3, 0),
+  ((2, 2, 2, 2, 5), row_3, 13),
+  ((2, 2, 2, 2, 5), row_4, 13),
+  ((3, 3, 3, 4, 5), row_4, 0),
+  ((6, 6, 6, 6, 1), row_4, 0),
+  ((2, 3, 3, 2, 3), b25, 25),
+  ((2, 2, 3, 3, 4), b25, 0),
+  ((4, 4, 4, 4, 4), b25, 0),
+  ((5, 3, 2, 6, 4), b40, 40),
+  ((1, 2, 3, 4, 5), b40, 40),
+  ((1, 2, 3, 4, 6), b40, 0),
+  ((5, 5, 5, 5, 5), b50, 50),
+  ((5, 5, 5, 5, 4), b50, 0),
+  ((5, 5, 5, 5, 5), row_4, 25),
+])
+def test_lower_section(dice, slot, score):
+  assert hand_scores(dice)[slot] == score
+
+def test_order_of_the_dice_does_not_matter():
+  assert hand_scores((6, 1, 3, 1, 6)) == hand_scores((1, 1, 3, 6, 6)) == compute_scores((1, 1, 3, 6, 6))
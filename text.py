@@ -1,91 +1,208 @@
 import pygame
 import secrets
+from collections import OrderedDict
+from runtime import get_font
 
 def randint(l, r):
   return l + secrets.randbelow(r - l + 1)
 
+# Rendered text surfaces, least recently used evicted once the pixels held
+# go over surface_cache_limit bytes
+surface_cache = OrderedDict()
+surface_cache_limit = 16 * 1024 * 1024
+surface_cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+# Colours go into cache keys, so lists and pygame.Color (mutable, unhashable)
+# become plain tuples; names stay as they are
+def color_key(color):
+  return color if isinstance(color, str) else tuple(pygame.Color(color))
+
+def render(text, font_size, text_color, antialias=True, char_spacing=0):
+  text_color = color_key(text_color)
+  key = (text, font_size, text_color, antialias, char_spacing)
+  surface = surface_cache.get(key)
+  if surface is not None:
+    surface_cache.move_to_end(key)
+    surface_cache_stats["hits"] += 1
+    return surface
+
+  surface_cache_stats["misses"] += 1
+  if char_spacing and len(text) > 1:
+    surface = compose_spaced(text, font_size, text_color, antialias, char_spacing)
+  else:
+    surface = get_font(font_size).render(text, antialias, text_color)
+  surface_cache[key] = surface
+  surface_cache_stats["bytes"] += surface.get_pitch() * surface.get_height()
+  while surface_cache_stats["bytes"] > surface_cache_limit and len(surface_cache) > 1:
+    _, old = surface_cache.popitem(last=False)
+    surface_cache_stats["bytes"] -= old.get_pitch() * old.get_height()
+    surface_cache_stats["evictions"] += 1
+  return surface
+
+glyph_widths = {}
+
+def glyph_width(font_size, char):
+  width = glyph_widths.get((font_size, char))
+  if width is None:
+    width = glyph_widths[(font_size, char)] = get_font(font_size).size(char)[0]
+  return width
+
+# Kerning between two glyphs, whatever the pair renders narrower or wider
+# than the two glyphs on their own
+pair_kernings = {}
+
+def pair_kerning(font_size, a, b):
+  kerning = pair_kernings.get((font_size, a, b))
+  if kerning is None:
+    kerning = get_font(font_size).size(a + b)[0] - glyph_width(font_size, a) - glyph_width(font_size, b)
+    pair_kernings[(font_size, a, b)] = kerning
+  return kerning
+
+# Letter-spaced text drawn once into a single surface so write() blits it in
+# one go instead of one blit per character every frame
+def compose_spaced(text, font_size, text_color, antialias, char_spacing):
+  positions = [0]
+  for a, b in zip(text, text[1:]):
+    positions.append(positions[-1] + glyph_width(font_size, a) + pair_kerning(font_size, a, b) + char_spacing)
+  left = min(0, min(positions))
+  width = max(x + glyph_width(font_size, c) for x, c in zip(positions, text)) - left
+  surface = pygame.Surface((max(1, width), get_font(font_size).get_height()), pygame.SRCALPHA)
+  for x, char in zip(positions, text):
+    surface.blit(render(char, font_size, text_color, antialias), (x - left, 0), special_flags=pygame.BLEND_RGBA_MAX)
+  return surface
+
+# Width a run of text renders at: what Font.size reports for plain text,
+# what compose_spaced lays out for letter-spaced text
+def measure(font_size, text, char_spacing=0):
+  if char_spacing and len(text) > 1:
+    return sum(glyph_width(font_size, a) + pair_kerning(font_size, a, b) + char_spacing
+               for a, b in zip(text, text[1:])) + glyph_width(font_size, text[-1])
+  return get_font(font_size).size(text)[0]
+
+word_widths = {}
+
+def word_width(font_size, word, char_spacing=0):
+  width = word_widths.get((font_size, word, char_spacing))
+  if width is None:
+    width = word_widths[(font_size, word, char_spacing)] = measure(font_size, word, char_spacing)
+  return width
+
+# Line breaks for multiline write, computed in one pass over the text from
+# cached word widths and kept per (text, width, size, spacing)
+layout_cache = OrderedDict()
+layout_cache_size = 256
+
+def wrap_lines(text, max_width, font_size, char_spacing=0):
+  key = (text, max_width, font_size, char_spacing)
+  lines = layout_cache.get(key)
+  if lines is not None:
+    layout_cache.move_to_end(key)
+    return lines
+
+  lines = []
+  space = glyph_width(font_size, " ") + 2 * char_spacing
+  for raw_line in text.split("\n"):
+    current_line = []
+    line_width = 0
+    for word in raw_line.split(" "):
+      if not word:
+        continue
+      width = word_width(font_size, word, char_spacing)
+      if current_line:
+        # Summed widths drift from the rendered width by a pixel or so per
+        # word, so plain text near the edge is measured for real
+        joined = (line_width + pair_kerning(font_size, current_line[-1][-1], " ") + space
+                  + pair_kerning(font_size, " ", word[0]) + width)
+        if not char_spacing and max_width - len(current_line) <= joined <= max_width:
+          joined = measure(font_size, "".join(current_line) + " " + word)
+        if joined <= max_width:
+          current_line.append(" ")
+          current_line.append(word)
+          line_width = joined
+          continue
+        lines.append("".join(current_line))
+        current_line = []
+      if width <= max_width:
+        current_line.append(word)
+        line_width = width
+        continue
+      # Word wider than the box, break it between characters
+      piece_start = 0
+      for i in range(1, len(word)):
+        if measure(font_size, word[piece_start:i + 1], char_spacing) > max_width:
+          lines.append(word[piece_start:i])
+          piece_start = i
+      current_line.append(word[piece_start:])
+      line_width = measure(font_size, word[piece_start:], char_spacing)
+    lines.append("".join(current_line))
+
+  lines = tuple(lines)
+  layout_cache[key] = lines
+  while len(layout_cache) > layout_cache_size:
+    layout_cache.popitem(last=False)
+  return lines
+
 def write(screen, button_rect, text, font_size, text_color, button_color, border, align="center", multiline=False, char_spacing=0):
-  font = pygame.font.Font(None, font_size)
   pygame.draw.rect(screen, button_color, button_rect)
   
   if multiline:
-    lines = []
-    max_width = button_rect.width - 2 * border
-    raw_lines = text.split("\n")
+    lines = wrap_lines(text, button_rect.width - 2 * border, font_size, char_spacing)
     
-    for raw_line in raw_lines:
-      current_line = ""
-      current_words = raw_line.split(" ") if raw_line else [""]
-      
-      for word in current_words:
-        word_with_space = word + " " if word else ""
-        word_width = sum(font.render(char, True, text_color).get_width() + char_spacing for char in word_with_space) - char_spacing if word else 0
-        if font.render(current_line, True, text_color).get_width() + word_width <= max_width:
-          current_line += word_with_space
-        else:
-          if current_line:
-            lines.append(current_line.strip())
-            current_line = ""
-          
-          temp_line = current_line
-          for i, char in enumerate(word):
-            char_surface = font.render(char, True, text_color)
-            char_width = char_surface.get_width() + char_spacing
-            if font.render(temp_line, True, text_color).get_width() + char_width <= max_width:
-              temp_line += char
-            else:
-              if temp_line:
-                lines.append(temp_line)
-              temp_line = char
-          current_line = temp_line
-          if word_with_space and word_with_space[-1] == " " and font.render(current_line + " ", True, text_color).get_width() + char_spacing <= max_width:
-            current_line += " "
-      
-      lines.append(current_line.strip() if current_line else "")
-      
-      for i, line in enumerate(lines):
-        if char_spacing == 0:
-          text_surface = font.render(line, True, text_color)
-          text_rect = text_surface.get_rect()
-          if align == "left":
-            text_rect.topleft = (button_rect.left + border, button_rect.top + border + i * font_size)
-          elif align == "right":
-            text_rect.topright = (button_rect.right - border, button_rect.top + border + i * font_size)
-          else:
-            text_rect.center = (button_rect.centerx, button_rect.top + border + i * font_size)
-          screen.blit(text_surface, text_rect)
-        else:
-          if align == "left":
-            x_pos = button_rect.left + border
-          elif align == "right":
-            x_pos = button_rect.right - border - sum(font.render(c, True, text_color).get_width() + char_spacing for c in line) + char_spacing
-          else:
-            x_pos = button_rect.centerx - sum(font.render(c, True, text_color).get_width() + char_spacing for c in line) / 2 + char_spacing / 2
-          y_pos = button_rect.top + border + i * font_size
-          for char in line:
-            char_surface = font.render(char, True, text_color)
-            screen.blit(char_surface, (x_pos, y_pos))
-            x_pos += char_surface.get_width() + char_spacing
-  else:
-    if char_spacing == 0:
-      text_surface = font.render(text, True, text_color)
+    for i, line in enumerate(lines):
+      text_surface = render(line, font_size, text_color, char_spacing=char_spacing)
       text_rect = text_surface.get_rect()
-      if align == "left":
-        text_rect.topleft = (button_rect.left + border, button_rect.top + border)
-      elif align == "right":
-        text_rect.topright = (button_rect.right - border, button_rect.top + border)
+      if char_spacing == 0:
+        if align == "left":
+          text_rect.topleft = (button_rect.left + border, button_rect.top + border + i * font_size)
+        elif align == "right":
+          text_rect.topright = (button_rect.right - border, button_rect.top + border + i * font_size)
+        else:
+          text_rect.center = (button_rect.centerx, button_rect.top + border + i * font_size)
       else:
-        text_rect.center = button_rect.center
+        text_rect.top = button_rect.top + border + i * font_size
+        if align == "left":
+          text_rect.left = button_rect.left + border
+        elif align == "right":
+          text_rect.right = button_rect.right - border
+        else:
+          text_rect.left = button_rect.centerx - text_rect.width / 2
       screen.blit(text_surface, text_rect)
+  else:
+    text_surface = render(text, font_size, text_color, char_spacing=char_spacing)
+    text_rect = text_surface.get_rect()
+    if align == "left":
+      text_rect.topleft = (button_rect.left + border, button_rect.top + border)
+    elif align == "right":
+      text_rect.topright = (button_rect.right - border, button_rect.top + border)
     else:
-      if align == "left":
-        x_pos = button_rect.left + border
-      elif align == "right":
-        x_pos = button_rect.right - border - sum(font.render(c, True, text_color).get_width() + char_spacing for c in text) + char_spacing
-      else:
-        x_pos = button_rect.centerx - sum(font.render(c, True, text_color).get_width() + char_spacing for c in text) / 2 + char_spacing / 2
-      y_pos = button_rect.top + border if align == "left" or align == "right" else button_rect.centery - font.get_height() / 2
-      for char in text:
-        char_surface = font.render(char, True, text_color)
-        screen.blit(char_surface, (x_pos, y_pos))
-        x_pos += char_surface.get_width() + char_spacing
\ No newline at end of file
+      text_rect.center = button_rect.center
+    screen.blit(text_surface, text_rect)
+
+# python text.py compares blitting letter-spaced text one character at a time
+# against the pre-composited surface
+if __name__ == "__main__":
+  import time
+  
+  pygame.init()
+  screen = pygame.display.set_mode((1600, 200))
+  
+  def write_per_char(screen, x_pos, y_pos, text, font_size, text_color, char_spacing):
+    font = pygame.font.Font(None, font_size)
+    for char in text:
+      char_surface = font.render(char, True, text_color)
+      screen.blit(char_surface, (x_pos, y_pos))
+      x_pos += char_surface.get_width() + char_spacing
+  
+  frames = 200
+  print("chars  per-char ms/frame  composited ms/frame")
+  for length in (10, 50, 100, 250, 500):
+    line = ("Quantum Yazy " * 40)[:length]
+    begin = time.perf_counter()
+    for _ in range(frames):
+      write_per_char(screen, 0, 0, line, 30, "white", 3)
+    per_char = (time.perf_counter() - begin) * 1000 / frames
+    begin = time.perf_counter()
+    for _ in range(frames):
+      screen.blit(render(line, 30, "white", char_spacing=3), (0, 0))
+    composited = (time.perf_counter() - begin) * 1000 / frames
+    print(f"{length:5} {per_char:18.3f} {composited:20.3f}")
@@ -0,0 +1,72 @@
+import pygame
+import time
+from text import *
+
+# Retained-mode board: every write() remembers what was last drawn in its rect
+# and only repaints and updates that rect when something about it changed.
+class Board:
+  def __init__(self, screen, draw_background):
+    self.screen = screen
+    self.background = pygame.Surface(screen.get_size())
+    draw_background(self.background)
+    self.drawn = {}
+    self.bounds = {}
+    self.dirty = []
+    self.full = True
+    self.frame_start = time.perf_counter()
+    self.stats = {"frames": 0, "busy": 0.0, "dirty_frames": 0, "dirty_pixels": 0}
+
+  def invalidate(self):
+    self.full = True
+
+  def write(self, button_rect, text, font_size, text_color, button_color, border, align="center", multiline=False, char_spacing=0):
+    key = tuple(button_rect)
+    state = (text, font_size, color_key(text_color), color_key(button_color), border, align, multiline, char_spacing)
+    if not self.full and self.drawn.get(key) == state:
+      return
+
+    # Text can be wider than its rect, so clear and update what it covered
+    old = self.bounds.get(key)
+    if old is not None and not self.full:
+      self.screen.blit(self.background, old, old)
+      self.dirty.append(old)
+
+    write(self.screen, button_rect, text, font_size, text_color, button_color, border, align, multiline, char_spacing)
+    new = pygame.Rect(button_rect)
+    if not multiline:
+      text_rect = render(text, font_size, text_color, char_spacing=char_spacing).get_rect()
+      if align == "left":
+        text_rect.topleft = (new.left + border, new.top + border)
+      elif align == "right":
+        text_rect.topright = (new.right - border, new.top + border)
+      else:
+        text_rect.center = new.center
+      new.union_ip(text_rect)
+    self.drawn[key] = state
+    self.bounds[key] = new
+    self.dirty.append(new)
+
+  def present(self):
+    if self.full:
+      pygame.display.flip()
+      self.full = False
+    elif self.dirty:
+      pygame.display.update(self.dirty)
+      self.stats["dirty_frames"] += 1
+      self.stats["dirty_pixels"] += sum(rect.width * rect.height for rect in self.dirty)
+    self.dirty = []
+    self.stats["frames"] += 1
+    self.stats["busy"] += time.perf_counter() - self.frame_start
+
+  def begin_frame(self):
+    self.frame_start = time.perf_counter()
+    if self.full:
+      self.screen.blit(self.background, (0, 0))
+      self.drawn.clear()
+      self.bounds.clear()
+
+  def report(self):
+    frames = max(self.stats["frames"], 1)
+    return (f"{self.stats['frames']} frames, {self.stats['busy'] * 1000 / frames:.3f} ms busy per frame, "
+            f"{self.stats['dirty_frames']} partial updates, "
+            f"{self.stats['dirty_pixels'] / frames:.0f} px updated per frame")
@@ -0,0 +1,94 @@
+from random import random
+from scoring import hand_scores, empty_scores, categories
+
+def random_die(sides):
+  return int(random() * sides) + 1
+
+# Yazy rules without any pygame, the board in yazy.start() just draws this.
+# Lists keep the board's layout: die[0], lock[0] and slot 0 of every score
+# row are unused.
+class YazyGame:
+  __slots__ = ("players", "draw", "die", "lock", "locka", "score", "roll", "round", "cnt_round")
+
+  def __init__(self, players, draw=None):
+    self.players = players
+    self.draw = draw if draw is not None else random_die
+    self.locka = [[0] * categories for _ in range(players)]
+    self.score = [[0] * categories for _ in range(players)]
+    self.round = 0
+    self.cnt_round = 0
+    self.new_turn()
+
+  def new_turn(self):
+    self.roll = 0
+    self.die = [0] * 6
+    self.lock = [0] * 6
+    self.update_scores()
+
+  # Unlocked slots of the current player show what the dice would score
+  def update_scores(self):
+    hand = hand_scores(self.die[1:]) if self.roll != 0 else empty_scores
+    locked = self.locka[self.round]
+    row = self.score[self.round]
+    for k in range(1, categories):
+      if not locked[k]:
+        row[k] = hand[k]
+
+  def can_roll(self):
+    return self.roll != 3 and sum(self.lock[1:]) != 5
+
+  def roll_dice(self):
+    if not self.can_roll():
+      return False
+    self.roll += 1
+    for i in range(1, 6):
+      if not self.lock[i]:
+        self.die[i] = self.draw(6)
+    self.update_scores()
+    return True
+
+  def toggle_lock(self, i):
+    if self.roll == 0 or self.roll == 3:
+      return False
+    self.lock[i] = 0 if self.lock[i] else 1
+    return True
+
+  def commit(self, k):
+    if self.roll == 0 or self.locka[self.round][k]:
+      return False
+    self.locka[self.round][k] = 1
+    self.next_player()
+    return True
+
+  def next_player(self):
+    self.round = (self.round + 1) % self.players
+    self.cnt_round += 1
+    self.new_turn()
+
+  def finished(self):
+    return self.cnt_round == self.players * (categories - 1)
+
+  def total(self, i):
+    locked = self.locka[i]
+    row = self.score[i]
+    return sum(row[k] for k in range(1, categories) if locked[k])
+
+  def open_categories(self):
+    locked = self.locka[self.round]
+    return [k for k in range(1, categories) if not locked[k]]
+
+  def ranking(self):
+    return rank([self.total(i) for i in range(self.players)])
+
+# (place, number, score) best first, numbered from 1, tied scores share a place
+def rank(scores):
+  winner = sorted(((i + 1, s) for i, s in enumerate(scores)), key = lambda x : x[1], reverse = True)
+  result = []
+  place = 0
+  last = None
+  for a, b in winner:
+    if last != b:
+      last = b
+      place += 1
+    result.append((place, a, b))
+  return result
@@ -0,0 +1,92 @@
+import argparse
+import time
+import numpy as np
+from scoring import hand_scores, categories
+
+# Monte Carlo for solitaire Yazy: every array row is one game, dice are an
+# (N, 5) uint8 matrix and the categories a game has used are bits of a uint16.
+turns = categories - 1
+powers = 6 ** np.arange(5)
+
+# Score of every ordered roll, indexed by the dice read as a base-6 number
+score_lut = np.array([hand_scores([i // 6 ** k % 6 + 1 for k in range(5)]) for i in range(6 ** 5)], dtype=np.int16)
+
+def roll_index(dice):
+  return (dice.astype(np.int32) - 1) @ powers
+
+def reroll(rng, dice, hold):
+  fresh = rng.integers(1, 7, size=dice.shape, dtype=np.uint8)
+  return np.where(hold, dice, fresh)
+
+def open_scores(dice, used):
+  scores = score_lut[roll_index(dice)].astype(np.int32)
+  taken = (used[:, None] >> np.arange(categories)) & 1
+  taken[:, 0] = 1
+  return np.where(taken == 1, -1, scores)
+
+# Hold rules, given the dice just rolled
+def hold_nothing(dice):
+  return np.zeros(dice.shape, dtype=bool)
+
+def hold_all(dice):
+  return np.ones(dice.shape, dtype=bool)
+
+def hold_most_common(dice):
+  counts = np.stack([(dice == face).sum(axis=1) for face in range(1, 7)], axis=1)
+  # Ties go to the higher face
+  mode = 6 - np.argmax(counts[:, ::-1], axis=1)
+  return dice == mode[:, None].astype(np.uint8)
+
+# Category rules, return the slot each game commits to
+def first_open(dice, used, rng):
+  return np.argmax(open_scores(dice, used) >= 0, axis=1)
+
+def best_open(dice, used, rng):
+  return np.argmax(open_scores(dice, used), axis=1)
+
+def random_open(dice, used, rng):
+  noise = rng.random((len(dice), categories))
+  return np.argmax(np.where(open_scores(dice, used) >= 0, noise, -1), axis=1)
+
+strategies = {
+  "first": (hold_all, first_open),
+  "random": (hold_nothing, random_open),
+  "greedy": (hold_nothing, best_open),
+  "hold_most": (hold_most_common, best_open),
+}
+
+def simulate(strategy, games, rng):
+  hold, choose = strategies[strategy]
+  used = np.zeros(games, dtype=np.uint16)
+  total = np.zeros(games, dtype=np.int32)
+  for _ in range(turns):
+    dice = rng.integers(1, 7, size=(games, 5), dtype=np.uint8)
+    for _ in range(2):
+      dice = reroll(rng, dice, hold(dice))
+    slot = choose(dice, used, rng)
+    total += score_lut[roll_index(dice), slot]
+    used |= (1 << slot).astype(np.uint16)
+  return total
+
+def run(strategy, games, batch, seed):
+  rng = np.random.Generator(np.random.PCG64(seed))
+  totals = []
+  begin = time.perf_counter()
+  for start in range(0, games, batch):
+    totals.append(simulate(strategy, min(batch, games - start), rng))
+  elapsed = time.perf_counter() - begin
+  totals = np.concatenate(totals)
+  return totals.mean(), totals.var(), games / elapsed
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Monte Carlo strategy evaluation for solitaire Yazy")
+  parser.add_argument("--games", type=int, default=1000000)
+  parser.add_argument("--batch", type=int, default=200000)
+  parser.add_argument("--seed", type=int, default=None)
+  parser.add_argument("--strategy", choices=list(strategies), action="append")
+  args = parser.parse_args()
+
+  print(f"{'strategy':10} {'mean':>9} {'variance':>10} {'games/s':>12}")
+  for strategy in args.strategy or list(strategies):
+    mean, variance, speed = run(strategy, args.games, args.batch, args.seed)
+    print(f"{strategy:10} {mean:9.2f} {variance:10.2f} {speed:12.0f}")
@@ -0,0 +1,146 @@
+import os
+import time
+from itertools import product
+from math import factorial
+import numpy as np
+from scoring import hand_scores, categories
+
+# Exact optimal play for solitaire Yazy. This board has no upper-section
+# bonus, so the categories already used are the whole state between turns:
+# 2^11 masks, category k is bit k - 1.
+turns = categories - 1
+masks = 1 << turns
+solver_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "yazy_solver.bin")
+magic = b"YAZYSOLV1\0"
+
+# Dice are handled as counts of each face; a keeper is what is held before a
+# reroll (0-5 dice), a hand is a full set of 5
+keepers = [c for c in product(range(6), repeat=6) if sum(c) <= 5]
+keeper_index = {c: i for i, c in enumerate(keepers)}
+hands = [c for c in keepers if sum(c) == 5]
+hand_index = {c: i for i, c in enumerate(hands)}
+
+def hand_dice(counts):
+  return [face + 1 for face in range(6) for _ in range(counts[face])]
+
+def build_tables():
+  # transition[keeper, hand]: chance a reroll of the other dice ends on hand
+  transition = np.zeros((len(keepers), len(hands)))
+  for i, keep in enumerate(keepers):
+    free = 5 - sum(keep)
+    for outcome in keepers:
+      if sum(outcome) != free:
+        continue
+      ways = factorial(free)
+      for c in outcome:
+        ways //= factorial(c)
+      hand = tuple(a + b for a, b in zip(keep, outcome))
+      transition[i, hand_index[hand]] += ways / 6 ** free
+
+  # Every keeper each hand can hold, padded with the empty keeper
+  sub = []
+  for hand in hands:
+    sub.append([keeper_index[k] for k in product(*(range(c + 1) for c in hand))])
+  width = max(len(s) for s in sub)
+  sub = np.array([s + [s[0]] * (width - len(s)) for s in sub])
+
+  scores = np.array([hand_scores(hand_dice(hand)) for hand in hands], dtype=np.float64)
+  return transition, sub, scores
+
+def solve():
+  transition, sub, scores = build_tables()
+  rows = np.arange(len(hands))
+  expected = np.zeros(masks)
+  hold = np.zeros((masks, 2, len(hands)), dtype=np.uint16)
+  commit = np.zeros((masks, len(hands)), dtype=np.uint8)
+
+  # A mask only leads to masks with more bits, so count down
+  for mask in range(masks - 2, -1, -1):
+    open_slots = [k for k in range(1, categories) if not mask >> (k - 1) & 1]
+    values = np.stack([scores[:, k] + expected[mask | 1 << (k - 1)] for k in open_slots], axis=1)
+    best = np.argmax(values, axis=1)
+    commit[mask] = np.array(open_slots)[best]
+    value = values[rows, best]
+    for roll in (2, 1):
+      kept = (transition @ value)[sub]
+      choice = np.argmax(kept, axis=1)
+      hold[mask, roll - 1] = sub[rows, choice]
+      value = kept[rows, choice]
+    expected[mask] = transition[keeper_index[(0,) * 6]] @ value
+  return expected.astype(np.float32), hold, commit
+
+def save(path=solver_file):
+  expected, hold, commit = solve()
+  # Written next to the real file and renamed over it, so a killed solve or
+  # two seats solving at once never leave a half-written table behind
+  partial = f"{path}.{os.getpid()}.tmp"
+  with open(partial, "wb") as f:
+    f.write(magic)
+    f.write(expected.tobytes())
+    f.write(hold.tobytes())
+    f.write(commit.tobytes())
+  os.replace(partial, path)
+
+file_size = len(magic) + masks * 4 + masks * 2 * len(hands) * 2 + masks * len(hands)
+
+def valid(path):
+  if not os.path.exists(path) or os.path.getsize(path) != file_size:
+    return False
+  with open(path, "rb") as f:
+    return f.read(len(magic)) == magic
+
+# Tables are memory mapped straight from the file, nothing is parsed
+def load(path=solver_file):
+  if not valid(path):
+    save(path)
+  offset = len(magic)
+  expected = np.memmap(path, dtype=np.float32, mode="r", offset=offset, shape=(masks,))
+  offset += expected.nbytes
+  hold = np.memmap(path, dtype=np.uint16, mode="r", offset=offset, shape=(masks, 2, len(hands)))
+  offset += hold.nbytes
+  commit = np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=(masks, len(hands)))
+  return expected, hold, commit
+
+tables = None
+
+# Maps the tables in once per process, solving them first if the file is
+# missing or bad. Callers open them up front (yazy.start(), tournament
+# workers), so best_move() never solves on the UI thread.
+def open_tables(path=solver_file):
+  global tables
+  if tables is None:
+    tables = load(path)
+  return tables
+
+def used_mask(locked):
+  mask = 0
+  for k in range(1, categories):
+    if locked[k]:
+      mask |= 1 << (k - 1)
+  return mask
+
+# Best move for one player: ("roll", None), ("hold", dice to keep) or
+# ("commit", category slot)
+def best_move(locked, dice, roll):
+  expected, hold, commit = tables
+  if roll == 0:
+    return ("roll", None)
+  mask = used_mask(locked)
+  counts = [0] * 6
+  for value in dice:
+    counts[value - 1] += 1
+  hand = hand_index[tuple(counts)]
+  if roll < 3:
+    keep = keepers[hold[mask, roll - 1, hand]]
+    if sum(keep) < 5:
+      return ("hold", hand_dice(keep))
+  return ("commit", int(commit[mask, hand]))
+
+def expected_score():
+  return float(open_tables()[0][0])
+
+if __name__ == "__main__":
+  begin = time.perf_counter()
+  save()
+  print(f"Solved {masks} states in {time.perf_counter() - begin:.2f}s, {os.path.getsize(solver_file)} bytes")
+  print(f"Expected score with optimal play: {expected_score():.3f}")
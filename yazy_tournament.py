@@ -0,0 +1,159 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import permutations
+import numpy as np
+from yazy_engine import YazyGame, rank
+import yazy_solver
+
+# Bot tournament: every match is a full YazyGame between bots, matches are
+# sharded over worker processes and each match seeds its own PCG stream from
+# (seed, match number), so results do not depend on how many workers ran.
+
+# Dice come from a per-match PCG64 stream, drawn in blocks like PcgEntropy
+class MatchDice:
+  def __init__(self, seed, match):
+    self.rng = np.random.Generator(np.random.PCG64([seed, match]))
+    self.block = []
+
+  def __call__(self, sides):
+    if not self.block:
+      self.block = self.rng.integers(1, sides + 1, size=256).tolist()
+    return self.block.pop()
+
+def roll_all(game):
+  while game.can_roll():
+    game.roll_dice()
+
+def best_open(game):
+  row = game.score[game.round]
+  return max(game.open_categories(), key = lambda k : row[k])
+
+# Bots play one whole turn of the current player
+def first_bot(game, rng):
+  game.roll_dice()
+  game.commit(game.open_categories()[0])
+
+def random_bot(game, rng):
+  roll_all(game)
+  slots = game.open_categories()
+  game.commit(slots[int(rng.random() * len(slots))])
+
+def greedy_bot(game, rng):
+  roll_all(game)
+  game.commit(best_open(game))
+
+def hold_most_bot(game, rng):
+  game.roll_dice()
+  while game.can_roll():
+    dice = game.die[1:]
+    # Ties go to the higher face
+    mode = max(range(6, 0, -1), key = dice.count)
+    for i in range(1, 6):
+      if (game.die[i] == mode) != bool(game.lock[i]):
+        game.toggle_lock(i)
+    if not game.roll_dice():
+      break
+  game.commit(best_open(game))
+
+def optimal_bot(game, rng):
+  while True:
+    move, arg = yazy_solver.best_move(game.locka[game.round], game.die[1:], game.roll)
+    if move == "commit":
+      game.commit(arg)
+      return
+    if move == "hold":
+      keep = list(arg)
+      for i in range(1, 6):
+        held = game.die[i] in keep
+        if held:
+          keep.remove(game.die[i])
+        if held != bool(game.lock[i]):
+          game.toggle_lock(i)
+    game.roll_dice()
+
+bots = {
+  "first": first_bot,
+  "random": random_bot,
+  "greedy": greedy_bot,
+  "hold_most": hold_most_bot,
+  "optimal": optimal_bot,
+}
+
+def schedule(names, rounds):
+  # Every ordered pairing, so each bot plays both seats against each other bot
+  pairings = list(permutations(names, 2))
+  return [pairings[i % len(pairings)] for i in range(rounds * len(pairings))]
+
+def play_match(seed, match, seats):
+  dice = MatchDice(seed, match)
+  rng = np.random.Generator(np.random.PCG64([seed, match, 1]))
+  game = YazyGame(len(seats), dice)
+  while not game.finished():
+    bots[seats[game.round]](game, rng)
+  scores = [game.total(i) for i in range(len(seats))]
+  return {"match": match, "seats": list(seats), "scores": scores, "ranking": rank(scores)}
+
+def play_shard(seed, start, seats_list):
+  return [play_match(seed, start + i, seats) for i, seats in enumerate(seats_list)]
+
+def run(names, rounds, seed, workers, shard, output=None):
+  matches = schedule(names, rounds)
+  shards = [(start, matches[start:start + shard]) for start in range(0, len(matches), shard)]
+  # Solve once up front, the workers then share the memory-mapped tables
+  optimal = "optimal" in names
+  if optimal:
+    yazy_solver.open_tables()
+
+  totals = {name: [0, 0, 0] for name in names}
+  out = open(output, "w") if output else None
+  begin = time.perf_counter()
+  with ProcessPoolExecutor(workers, initializer=yazy_solver.open_tables if optimal else None) as executor:
+    futures = [executor.submit(play_shard, seed, start, part) for start, part in shards]
+    for future in futures:
+      for result in future.result():
+        if out:
+          out.write(json.dumps(result) + "\n")
+        for place, player, score in result["ranking"]:
+          entry = totals[result["seats"][player - 1]]
+          entry[0] += place == 1
+          entry[1] += score
+          entry[2] += 1
+  elapsed = time.perf_counter() - begin
+  if out:
+    out.close()
+  return totals, len(matches), elapsed
+
+def standings(totals):
+  names = list(totals)
+  result = []
+  for place, number, wins in rank([totals[name][0] for name in names]):
+    name = names[number - 1]
+    result.append((place, name, wins, totals[name][1] / max(totals[name][2], 1)))
+  return result
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Parallel bot tournament for Yazy")
+  parser.add_argument("--bots", nargs="+", choices=list(bots), default=list(bots))
+  parser.add_argument("--rounds", type=int, default=50)
+  parser.add_argument("--seed", type=int, default=0)
+  parser.add_argument("--workers", type=int, default=os.cpu_count())
+  parser.add_argument("--shard", type=int, default=25)
+  parser.add_argument("--output", default="yazy_tournament.jsonl")
+  parser.add_argument("--scaling", action="store_true", help="time the same tournament on 1, 2, 4 and 8 workers")
+  args = parser.parse_args()
+
+  if args.scaling:
+    print(f"{os.cpu_count()} cpus")
+    base = None
+    for workers in (1, 2, 4, 8):
+      totals, matches, elapsed = run(args.bots, args.rounds, args.seed, workers, args.shard)
+      base = base or elapsed
+      print(f"{workers} workers: {matches / elapsed:8.1f} matches/s, speedup {base / elapsed:.2f}")
+  else:
+    totals, matches, elapsed = run(args.bots, args.rounds, args.seed, args.workers, args.shard, args.output)
+    print(f"{matches} matches in {elapsed:.2f}s on {args.workers} workers, results in {args.output}")
+    for place, name, wins, mean in standings(totals):
+      print(f"{place}. {name:10} {wins:5} wins {mean:8.2f} mean")